@@ -5,7 +5,13 @@ PM Jira Agent Multi-Agent System
 High-quality Jira ticket creation through intelligent multi-agent workflows
 """
 
-from .orchestrator import MultiAgentOrchestrator, create_jira_ticket_with_ai
+from .orchestrator import (
+    MultiAgentOrchestrator,
+    create_jira_ticket_with_ai,
+    create_jira_ticket_with_ai_batch,
+    create_jira_ticket_with_ai_in_session,
+    orchestrator_session
+)
 from .pm_agent import PMAgent
 from .tech_lead_agent import TechLeadAgent
 from .jira_agent import JiraCreatorAgent
@@ -20,6 +26,9 @@ __all__ = [
     # Main orchestrator
     "MultiAgentOrchestrator",
     "create_jira_ticket_with_ai",
+    "create_jira_ticket_with_ai_batch",
+    "create_jira_ticket_with_ai_in_session",
+    "orchestrator_session",
     
     # Individual agents
     "PMAgent",
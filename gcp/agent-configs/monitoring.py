@@ -8,7 +8,7 @@ Comprehensive monitoring, metrics collection, and analytics for the multi-agent
 import time
 import logging
 import json
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime, timedelta
 from dataclasses import dataclass, asdict
 from enum import Enum
@@ -126,6 +126,30 @@ class MonitoringSystem:
                             error_message: Optional[str] = None) -> None:
         """Track individual agent execution metrics"""
         
+        self._record_agent_execution(
+            self._find_workflow_metrics(workflow_id), workflow_id, agent_name,
+            execution_time, success, quality_score, iteration, error_message
+        )
+    
+    def track_agent_executions(self, workflow_id: str,
+                             executions: List[Tuple[str, float, bool, Optional[float], int]]) -> None:
+        """Track several agent executions of one workflow, given as
+        (agent_name, execution_time, success, quality_score, iteration) tuples"""
+        
+        # Look the workflow up once for the whole batch
+        workflow_metrics = self._find_workflow_metrics(workflow_id)
+        for agent_name, execution_time, success, quality_score, iteration in executions:
+            self._record_agent_execution(
+                workflow_metrics, workflow_id, agent_name,
+                execution_time, success, quality_score, iteration
+            )
+    
+    def _record_agent_execution(self, workflow_metrics: Optional[WorkflowMetrics], workflow_id: str,
+                              agent_name: str, execution_time: float, success: bool,
+                              quality_score: Optional[float] = None, iteration: int = 1,
+                              error_message: Optional[str] = None) -> None:
+        """Store, log and export one agent execution"""
+        
         agent_metrics = AgentMetrics(
             agent_name=agent_name,
             execution_time=execution_time,
@@ -139,7 +163,6 @@ class MonitoringSystem:
         self.metrics_store["agents"].append(agent_metrics)
         
         # Update workflow metrics
-        workflow_metrics = self._find_workflow_metrics(workflow_id)
         if workflow_metrics:
             workflow_metrics.agent_execution_times[agent_name] = execution_time
             if quality_score:
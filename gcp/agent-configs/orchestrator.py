@@ -5,10 +5,14 @@ Multi-Agent Orchestrator - Coordinating PM Jira Agent Workflow
 Orchestrates the workflow between PM Agent, Tech Lead Agent, and Jira Creator Agent
 """
 
+import os
 import time
 import json
 import logging
-from typing import Dict, Any, List, Optional
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager, nullcontext
+from typing import Dict, Any, Iterator, List, Optional
 from datetime import datetime
 
 from pm_agent import PMAgent
@@ -41,21 +45,41 @@ class MultiAgentOrchestrator:
         self.quality_threshold = 0.8
         self.iteration_timeout = 300  # 5 minutes per iteration
         
+        # Workflows in flight; close() waits for them before releasing the agents' sessions
+        self._active_workflows = 0
+        self._workflows_idle = threading.Condition()
+        
         logger.info(f"Multi-Agent Orchestrator initialized for project {project_id}")
     
-    def create_jira_ticket(self, user_request: str, context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    def create_jira_ticket(self, user_request: str, context: Optional[Dict[str, Any]] = None,
+                           deadline: Optional[float] = None) -> Dict[str, Any]:
         """
         Main entry point for creating a Jira ticket through multi-agent workflow
         
         Args:
             user_request: User's request or requirement
             context: Additional context information
+            deadline: time.monotonic() value after which the workflow stops at its next
+                phase, before any ticket is created
             
         Returns:
             Dictionary containing complete workflow results and created ticket
         """
+        with self._workflows_idle:
+            self._active_workflows += 1
+        try:
+            return self._run_workflow(user_request, context, deadline)
+        finally:
+            with self._workflows_idle:
+                self._active_workflows -= 1
+                self._workflows_idle.notify_all()
+    
+    def _run_workflow(self, user_request: str, context: Optional[Dict[str, Any]],
+                      deadline: Optional[float]) -> Dict[str, Any]:
+        """Run the PM, business rules, Tech Lead and Jira phases for one request"""
+        
         workflow_start_time = time.time()
-        workflow_id = f"workflow_{int(workflow_start_time)}"
+        workflow_id = f"workflow_{int(workflow_start_time)}_{os.urandom(4).hex()}"
         
         logger.info(f"Starting multi-agent workflow {workflow_id} for request: {user_request[:100]}...")
         
@@ -71,12 +95,18 @@ class MultiAgentOrchestrator:
                 "agent_interactions": []
             }
             
+            if self._deadline_passed(deadline):
+                return self._create_timeout_response(workflow_context, "PM Agent analysis")
+            
             # Phase 1: PM Agent Analysis
             pm_result = self._execute_pm_analysis(user_request, context, workflow_context)
             
             if not pm_result["success"]:
                 return self._create_failure_response(workflow_context, "PM Agent analysis failed", pm_result)
             
+            if self._deadline_passed(deadline):
+                return self._create_timeout_response(workflow_context, "business rules")
+            
             # Phase 2: Apply Business Rules
             business_rules_result = self._apply_business_rules(pm_result, workflow_context)
             
@@ -84,11 +114,18 @@ class MultiAgentOrchestrator:
                 return self._create_failure_response(workflow_context, "Business rules application failed", business_rules_result)
             
             # Phase 3: Iterative Quality Improvement Loop
-            final_result = self._execute_quality_improvement_loop(business_rules_result, workflow_context)
+            final_result = self._execute_quality_improvement_loop(business_rules_result, workflow_context, deadline)
+            
+            if final_result.get("error") == "timeout":
+                return self._create_timeout_response(workflow_context, "the next quality improvement iteration")
             
             if not final_result["success"]:
                 return self._create_failure_response(workflow_context, "Quality improvement failed", final_result)
             
+            # Creating the ticket is the only external side effect, so it is the last chance to stop
+            if self._deadline_passed(deadline):
+                return self._create_timeout_response(workflow_context, "ticket creation")
+            
             # Phase 4: Final Ticket Creation
             creation_result = self._execute_ticket_creation(final_result, workflow_context)
             
@@ -117,6 +154,13 @@ class MultiAgentOrchestrator:
             "message": "Workflow status tracking not implemented in this version"
         }
     
+    def close(self):
+        """Release HTTP connections held by the agents' Cloud Function tools once no workflow is running"""
+        with self._workflows_idle:
+            self._workflows_idle.wait_for(lambda: self._active_workflows == 0)
+        for agent in (self.pm_agent, self.tech_lead_agent, self.jira_creator_agent):
+            agent.tools.close()
+    
     def _execute_pm_analysis(self, user_request: str, context: Optional[Dict[str, Any]], workflow_context: Dict[str, Any]) -> Dict[str, Any]:
         """Execute PM Agent analysis phase"""
         
@@ -183,7 +227,8 @@ class MultiAgentOrchestrator:
             logger.error(f"Business rules application failed: {business_rules_result.get('error')}")
             return business_rules_result
     
-    def _execute_quality_improvement_loop(self, business_rules_result: Dict[str, Any], workflow_context: Dict[str, Any]) -> Dict[str, Any]:
+    def _execute_quality_improvement_loop(self, business_rules_result: Dict[str, Any], workflow_context: Dict[str, Any],
+                                          deadline: Optional[float] = None) -> Dict[str, Any]:
         """Execute iterative quality improvement loop between PM and Tech Lead agents"""
         
         logger.info("Phase 3: Quality Improvement Loop")
@@ -193,6 +238,9 @@ class MultiAgentOrchestrator:
         iteration = 1
         
         while iteration <= self.max_iterations:
+            if self._deadline_passed(deadline):
+                return {"success": False, "error": "timeout", "workflow_context": workflow_context}
+            
             workflow_context["iteration_count"] = iteration
             logger.info(f"Quality improvement iteration {iteration}/{self.max_iterations}")
             
@@ -392,6 +440,21 @@ class MultiAgentOrchestrator:
             "retry_possible": True
         }
     
+    @staticmethod
+    def _deadline_passed(deadline: Optional[float]) -> bool:
+        """Whether the workflow deadline, if any, has passed"""
+        return deadline is not None and time.monotonic() >= deadline
+    
+    def _create_timeout_response(self, workflow_context: Dict[str, Any], phase: str) -> Dict[str, Any]:
+        """Create failure response for a workflow stopped at its deadline"""
+        
+        logger.warning(f"Workflow {workflow_context['workflow_id']} reached its deadline before {phase}")
+        response = self._create_failure_response(
+            workflow_context, f"Workflow deadline reached before {phase}", {"error": "timeout"}
+        )
+        response["error"] = "timeout"
+        return response
+    
     def _calculate_workflow_statistics(self, workflow_context: Dict[str, Any], total_duration: float) -> Dict[str, Any]:
         """Calculate comprehensive workflow statistics"""
         
@@ -446,5 +509,83 @@ def create_jira_ticket_with_ai(user_request: str, context: Optional[Dict[str, An
     return orchestrator.create_jira_ticket(user_request, context)
 
 
+@contextmanager
+def orchestrator_session(project_id: str = "service-execution-uat-bb7",
+                         location: str = "europe-west9") -> Iterator[MultiAgentOrchestrator]:
+    """
+    Share one orchestrator across many requests
+    
+    Agents, GCP credentials and pooled HTTP connections are set up once and
+    reused by every call made inside the session.
+    
+    Yields:
+        Orchestrator to pass to create_jira_ticket_with_ai_in_session
+    """
+    orchestrator = MultiAgentOrchestrator(project_id, location)
+    try:
+        yield orchestrator
+    finally:
+        orchestrator.close()
+
+
+def create_jira_ticket_with_ai_in_session(session: MultiAgentOrchestrator, user_request: str,
+                                          context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    Create a Jira ticket using an orchestrator opened with orchestrator_session
+    
+    Args:
+        session: Orchestrator yielded by orchestrator_session
+        user_request: User's request or requirement
+        context: Additional context information
+        
+    Returns:
+        Dictionary containing complete workflow results
+    """
+    return session.create_jira_ticket(user_request, context)
+
+
+def create_jira_ticket_with_ai_batch(user_requests: List[str], context: Optional[Dict[str, Any]] = None,
+                                     max_batch: int = 16, timeout: Optional[float] = None,
+                                     session: Optional[MultiAgentOrchestrator] = None) -> List[Dict[str, Any]]:
+    """
+    Create several Jira tickets in one dispatch, running the workflows concurrently
+    
+    Args:
+        user_requests: User requests to process
+        context: Additional context information shared by all requests
+        max_batch: Maximum number of workflows running at the same time
+        timeout: Seconds the whole batch may take; workflows still running then stop at their
+            next phase without creating a ticket and are reported with error "timeout"
+        session: Orchestrator from orchestrator_session to reuse instead of creating one
+        
+    Returns:
+        List of workflow results in the same order as user_requests
+    """
+    if not user_requests:
+        return []
+    
+    # One orchestrator (and its agents) serves the whole batch; one created here is closed afterwards
+    with nullcontext(session) if session is not None else orchestrator_session() as orchestrator:
+        # Workflows check the deadline between phases, so none creates a ticket after it and
+        # every worker has finished by the time the batch returns
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        with ThreadPoolExecutor(max_workers=min(max_batch, len(user_requests))) as executor:
+            futures = [executor.submit(orchestrator.create_jira_ticket, request, context, deadline)
+                       for request in user_requests]
+            results = [future.result() for future in futures]
+    
+    overrun = time.monotonic() - deadline if deadline is not None else 0.0
+    if overrun > 0:
+        logger.warning(f"Batch of {len(user_requests)} workflows overran its {timeout}s budget by {overrun:.2f}s")
+    
+    return results
+
+
 # Export main classes and functions
-__all__ = ["MultiAgentOrchestrator", "create_jira_ticket_with_ai"]
\ No newline at end of file
+__all__ = [
+    "MultiAgentOrchestrator",
+    "create_jira_ticket_with_ai",
+    "create_jira_ticket_with_ai_batch",
+    "create_jira_ticket_with_ai_in_session",
+    "orchestrator_session"
+]
\ No newline at end of file
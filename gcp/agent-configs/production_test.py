@@ -6,78 +6,237 @@ Tests the production-ready multi-agent system with comprehensive validation
 Demonstrates enterprise-grade functionality
 """
 
+import io
 import os
+import sys
 import time
 import json
+import hashlib
 import logging
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Sequence, Tuple
 from datetime import datetime
 
-from orchestrator import create_jira_ticket_with_ai
+from orchestrator import (
+    MultiAgentOrchestrator,
+    create_jira_ticket_with_ai,
+    create_jira_ticket_with_ai_batch,
+    create_jira_ticket_with_ai_in_session,
+    orchestrator_session
+)
 
 # Set up logging
-logging.basicConfig(level=logging.INFO)
+logging.basicConfig(level=os.getenv("LOG_LEVEL", "INFO"))
 logger = logging.getLogger(__name__)
 
+# Prefer the native orjson encoder for result files, fall back to stdlib json
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Per-suite results are appended here as each suite completes
+RESULTS_STREAM_FILE = "production_deployment_test_results.jsonl"
+
+# Suite name, tested count key, passed count key and minimum success rate for production readiness
+SUITES: Tuple[Tuple[str, str, str, int], ...] = (
+    ("complex_scenarios", "scenarios_tested", "scenarios_passed", 75),
+    ("performance_benchmarks", "benchmarks_tested", "benchmarks_passed", 75),
+    ("enterprise_features", "features_tested", "features_working", 80)
+)
+
+# Time budget for the concurrent batch, in multiples of the slowest single workflow measured
+# before it; workflows still running after it stop before creating a ticket and count as failures
+CONCURRENT_TIMEOUT_FACTOR = 3.0
+
+# Simple request shared by the complex scenario and response time suites
+SIMPLE_REQUEST = "Fix the submit button styling on the login page - it's not aligned properly with the form fields"
+
+# Test data shared by every run
+_TEST_SCENARIOS: Tuple[Dict[str, str], ...] = (
+    {
+        "name": "OAuth Authentication with GDPR Compliance",
+        "request": "Implement OAuth 2.0 authentication system with GDPR compliance, secure session management, and audit logging for European users",
+        "expected_complexity": "high"
+    },
+    {
+        "name": "API Rate Limiting with Performance Monitoring",
+        "request": "Add intelligent API rate limiting with performance monitoring, auto-scaling triggers, and detailed analytics dashboard",
+        "expected_complexity": "medium"
+    },
+    {
+        "name": "Multi-tenant Data Isolation",
+        "request": "Implement multi-tenant data isolation with role-based access control and tenant-specific configurations",
+        "expected_complexity": "high"
+    },
+    {
+        "name": "Simple Bug Fix",
+        "request": SIMPLE_REQUEST,
+        "expected_complexity": "low"
+    }
+)
+
+_BENCHMARK_TESTS: Tuple[Dict[str, str], ...] = (
+    {"name": "Response Time", "target": "<2s", "test": "simple_request"},
+    {"name": "Quality Score", "target": "≥0.8", "test": "quality_validation"},
+    {"name": "Complex Request", "target": "<5s", "test": "complex_request"},
+    {"name": "Concurrent Processing", "target": "Multiple requests", "test": "concurrency"}
+)
+
+_COMPLEX_REQUEST = (
+    "Implement comprehensive user analytics dashboard with real-time data visualization, "
+    "advanced filtering capabilities, export functionality, role-based access control, "
+    "and integration with third-party analytics services like Google Analytics and Mixpanel"
+)
+
+_CONCURRENT_REQUESTS: Tuple[str, ...] = (
+    "Add user profile settings",
+    "Implement password reset functionality",
+    "Create admin user management panel"
+)
+
+_ENTERPRISE_TESTS: Tuple[Dict[str, str], ...] = (
+    {"name": "Business Rules Engine", "feature": "business_rules"},
+    {"name": "Quality Gates", "feature": "quality_gates"},
+    {"name": "Workflow Monitoring", "feature": "monitoring"},
+    {"name": "Error Handling", "feature": "error_handling"},
+    {"name": "Audit Logging", "feature": "audit_logging"}
+)
+
+_ENTERPRISE_REQUEST = """
+Implement a comprehensive enterprise user management system with the following requirements:
+
+FUNCTIONAL REQUIREMENTS:
+- Multi-tenant user provisioning and deprovisioning
+- Integration with Active Directory and LDAP
+- Role-based access control with granular permissions
+- Single Sign-On (SSO) with SAML 2.0 and OAuth 2.0
+- User lifecycle management with automated workflows
+
+NON-FUNCTIONAL REQUIREMENTS:
+- GDPR and SOC 2 compliance
+- 99.9% uptime SLA requirement
+- Support for 10,000+ concurrent users
+- Response time <500ms for authentication
+- Comprehensive audit logging and monitoring
+
+SECURITY REQUIREMENTS:
+- Multi-factor authentication (MFA)
+- Password policy enforcement
+- Session management with automatic timeout
+- Encryption at rest and in transit
+- Regular security vulnerability assessments
+"""
+
+# Orchestrator shared by all suites while a session is open (see main)
+_session: Optional[MultiAgentOrchestrator] = None
+
+# Responses keyed on the SHA-256 of the request, kept for the duration of the test run
+_cache: Dict[str, Dict[str, Any]] = {}
+
+# Time taken by the call that produced each cached response
+_latency: Dict[str, float] = {}
+
+def _cache_key(user_request: str) -> str:
+    """Deterministic cache key for a user request"""
+    
+    return hashlib.sha256(user_request.encode()).hexdigest()
+
+def _timed_call(user_request: str) -> Tuple[Dict[str, Any], float]:
+    """Return the response for a request with the latency of the call that produced it"""
+    
+    key = _cache_key(user_request)
+    if key not in _cache:
+        start_time = time.perf_counter()
+        if _session is not None:
+            _cache[key] = create_jira_ticket_with_ai_in_session(_session, user_request)
+        else:
+            _cache[key] = create_jira_ticket_with_ai(user_request)
+        _latency[key] = time.perf_counter() - start_time
+    
+    return _cache[key], _latency[key]
+
+def _cached_call(user_request: str) -> Dict[str, Any]:
+    """Call create_jira_ticket_with_ai once per distinct request and reuse the result"""
+    
+    return _timed_call(user_request)[0]
+
+def _cached_batch(user_requests: Sequence[str], timeout: Optional[float] = None) -> List[Dict[str, Any]]:
+    """Dispatch all uncached requests in a single batch and return results in request order"""
+    
+    keys = [_cache_key(request) for request in user_requests]
+    pending = [(key, request) for key, request in zip(keys, user_requests) if key not in _cache]
+    
+    if pending:
+        start_time = time.perf_counter()
+        batch_results = create_jira_ticket_with_ai_batch(
+            [request for _, request in pending], timeout=timeout, session=_session
+        )
+        batch_time = time.perf_counter() - start_time
+        for (key, _), result in zip(pending, batch_results):
+            _cache[key] = result
+            _latency[key] = batch_time
+    
+    return [_cache[key] for key in keys]
+
+def _stream_suite_result(suite_name: str, suite_results: Dict[str, Any]) -> None:
+    """Append one completed suite as a JSON line so partial results survive a crash"""
+    
+    record = {"suite": suite_name, "data": suite_results}
+    with open(RESULTS_STREAM_FILE, "ab") as f:
+        if ORJSON_AVAILABLE:
+            f.write(orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE))
+        else:
+            f.write((json.dumps(record) + "\n").encode())
+        f.flush()
+
+def _flush_output(buf: io.StringIO) -> None:
+    """Write buffered console output in a single call and reset the buffer"""
+    
+    sys.stdout.write(buf.getvalue())
+    sys.stdout.flush()
+    buf.seek(0)
+    buf.truncate()
+
 def test_complex_scenarios() -> Dict[str, Any]:
     """Test complex real-world scenarios"""
     
     logger.info("🎯 Testing complex real-world scenarios...")
     
-    test_scenarios = [
-        {
-            "name": "OAuth Authentication with GDPR Compliance",
-            "request": "Implement OAuth 2.0 authentication system with GDPR compliance, secure session management, and audit logging for European users",
-            "expected_complexity": "high"
-        },
-        {
-            "name": "API Rate Limiting with Performance Monitoring",
-            "request": "Add intelligent API rate limiting with performance monitoring, auto-scaling triggers, and detailed analytics dashboard",
-            "expected_complexity": "medium"
-        },
-        {
-            "name": "Multi-tenant Data Isolation",
-            "request": "Implement multi-tenant data isolation with role-based access control and tenant-specific configurations",
-            "expected_complexity": "high"
-        },
-        {
-            "name": "Simple Bug Fix",
-            "request": "Fix the submit button styling on the login page - it's not aligned properly with the form fields",
-            "expected_complexity": "low"
-        }
-    ]
-    
-    results = {
-        "scenarios_tested": len(test_scenarios),
+    results: Dict[str, Any] = {
+        "scenarios_tested": len(_TEST_SCENARIOS),
         "scenarios_passed": 0,
         "scenario_results": [],
         "performance_metrics": {
             "total_time": 0,
-            "avg_time_per_scenario": 0,
-            "quality_scores": []
+            "avg_time_per_scenario": 0
         }
     }
     
-    total_start_time = time.time()
+    # Running total for the average quality score
+    quality_score_sum = 0.0
+    quality_score_count = 0
     
-    for scenario in test_scenarios:
-        logger.info(f"Testing scenario: {scenario['name']}")
+    total_start_time = time.perf_counter()
+    
+    for scenario in _TEST_SCENARIOS:
+        logger.info("Testing scenario: %s", scenario["name"])
         
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         try:
-            result = create_jira_ticket_with_ai(scenario["request"])
-            execution_time = time.time() - start_time
+            result, execution_time = _timed_call(scenario["request"])
+            quality_metrics = result.get("quality_metrics") or {}
             
-            scenario_result = {
+            scenario_result: Dict[str, Any] = {
                 "name": scenario["name"],
                 "request": scenario["request"],
                 "success": result.get("success", False),
                 "execution_time": round(execution_time, 2),
-                "quality_score": result.get("quality_metrics", {}).get("final_quality_score", 0),
+                "quality_score": quality_metrics.get("final_quality_score", 0),
                 "ticket_created": result.get("ticket_created", False),
                 "ticket_key": result.get("ticket_key"),
-                "iterations": result.get("quality_metrics", {}).get("iterations_required", 0),
+                "iterations": quality_metrics.get("iterations_required", 0),
                 "expected_complexity": scenario["expected_complexity"]
             }
             
@@ -89,9 +248,10 @@ def test_complex_scenarios() -> Dict[str, Any]:
                 scenario_result["error"] = result.get("error", "Unknown error")
             
             results["scenario_results"].append(scenario_result)
-            results["performance_metrics"]["quality_scores"].append(scenario_result["quality_score"])
+            quality_score_sum += scenario_result["quality_score"]
+            quality_score_count += 1
             
-            logger.info(f"{scenario_result['status']} - {scenario['name']} ({execution_time:.2f}s)")
+            logger.info("%s - %s (%.2fs)", scenario_result["status"], scenario["name"], execution_time)
             
         except Exception as e:
             scenario_result = {
@@ -100,21 +260,19 @@ def test_complex_scenarios() -> Dict[str, Any]:
                 "success": False,
                 "status": "❌ ERROR",
                 "error": str(e),
-                "execution_time": time.time() - start_time
+                "execution_time": time.perf_counter() - start_time
             }
             results["scenario_results"].append(scenario_result)
-            logger.error(f"❌ ERROR - {scenario['name']}: {str(e)}")
+            logger.error("❌ ERROR - %s: %s", scenario["name"], e)
     
     # Calculate performance metrics
-    results["performance_metrics"]["total_time"] = round(time.time() - total_start_time, 2)
+    results["performance_metrics"]["total_time"] = round(time.perf_counter() - total_start_time, 2)
     results["performance_metrics"]["avg_time_per_scenario"] = round(
         results["performance_metrics"]["total_time"] / results["scenarios_tested"], 2
     )
     
-    if results["performance_metrics"]["quality_scores"]:
-        results["performance_metrics"]["avg_quality_score"] = round(
-            sum(results["performance_metrics"]["quality_scores"]) / len(results["performance_metrics"]["quality_scores"]), 3
-        )
+    if quality_score_count:
+        results["performance_metrics"]["avg_quality_score"] = round(quality_score_sum / quality_score_count, 3)
     
     results["success_rate"] = (results["scenarios_passed"] / results["scenarios_tested"]) * 100
     
@@ -125,24 +283,15 @@ def test_performance_benchmarks() -> Dict[str, Any]:
     
     logger.info("⚡ Testing performance benchmarks...")
     
-    benchmark_tests = [
-        {"name": "Response Time", "target": "<2s", "test": "simple_request"},
-        {"name": "Quality Score", "target": "≥0.8", "test": "quality_validation"},
-        {"name": "Complex Request", "target": "<5s", "test": "complex_request"},
-        {"name": "Concurrent Processing", "target": "Multiple requests", "test": "concurrency"}
-    ]
-    
-    results = {
-        "benchmarks_tested": len(benchmark_tests),
+    results: Dict[str, Any] = {
+        "benchmarks_tested": len(_BENCHMARK_TESTS),
         "benchmarks_passed": 0,
         "benchmark_results": []
     }
     
     # Test 1: Response Time (Simple Request)
     logger.info("Testing response time with simple request...")
-    start_time = time.time()
-    simple_result = create_jira_ticket_with_ai("Add loading spinner to the dashboard")
-    simple_time = time.time() - start_time
+    simple_result, simple_time = _timed_call(SIMPLE_REQUEST)
     
     results["benchmark_results"].append({
         "name": "Response Time",
@@ -157,7 +306,7 @@ def test_performance_benchmarks() -> Dict[str, Any]:
     
     # Test 2: Quality Score
     logger.info("Testing quality score validation...")
-    quality_score = simple_result.get("quality_metrics", {}).get("final_quality_score", 0)
+    quality_score = (simple_result.get("quality_metrics") or {}).get("final_quality_score", 0)
     
     results["benchmark_results"].append({
         "name": "Quality Score",
@@ -172,13 +321,7 @@ def test_performance_benchmarks() -> Dict[str, Any]:
     
     # Test 3: Complex Request
     logger.info("Testing complex request processing...")
-    start_time = time.time()
-    complex_result = create_jira_ticket_with_ai(
-        "Implement comprehensive user analytics dashboard with real-time data visualization, "
-        "advanced filtering capabilities, export functionality, role-based access control, "
-        "and integration with third-party analytics services like Google Analytics and Mixpanel"
-    )
-    complex_time = time.time() - start_time
+    complex_result, complex_time = _timed_call(_COMPLEX_REQUEST)
     
     results["benchmark_results"].append({
         "name": "Complex Request",
@@ -191,34 +334,27 @@ def test_performance_benchmarks() -> Dict[str, Any]:
     if complex_time < 5.0:
         results["benchmarks_passed"] += 1
     
-    # Test 4: Simulated Concurrency (Sequential for now)
-    logger.info("Testing concurrent processing simulation...")
-    concurrent_start = time.time()
-    concurrent_requests = [
-        "Add user profile settings",
-        "Implement password reset functionality",
-        "Create admin user management panel"
-    ]
-    
-    concurrent_results = []
-    for req in concurrent_requests:
-        req_start = time.time()
-        req_result = create_jira_ticket_with_ai(req)
-        req_time = time.time() - req_start
+    # Test 4: Concurrent Processing (single batched dispatch)
+    logger.info("Testing concurrent processing...")
+    concurrent_start = time.perf_counter()
+    
+    concurrent_results: List[Dict[str, Any]] = []
+    concurrent_timeout = CONCURRENT_TIMEOUT_FACTOR * max(simple_time, complex_time)
+    for req, req_result in zip(_CONCURRENT_REQUESTS, _cached_batch(_CONCURRENT_REQUESTS, timeout=concurrent_timeout)):
         concurrent_results.append({
             "request": req,
-            "time": req_time,
+            "time": req_result.get("workflow_statistics", {}).get("total_workflow_duration", 0),
             "success": req_result.get("success", False)
         })
     
-    total_concurrent_time = time.time() - concurrent_start
-    avg_concurrent_time = total_concurrent_time / len(concurrent_requests)
+    total_concurrent_time = time.perf_counter() - concurrent_start
+    avg_concurrent_time = total_concurrent_time / len(_CONCURRENT_REQUESTS)
     concurrent_success_rate = sum(1 for r in concurrent_results if r["success"]) / len(concurrent_results)
     
     results["benchmark_results"].append({
         "name": "Concurrent Processing",
         "target": "Multiple requests",
-        "actual": f"{len(concurrent_requests)} requests in {total_concurrent_time:.2f}s (avg: {avg_concurrent_time:.2f}s)",
+        "actual": f"{len(_CONCURRENT_REQUESTS)} requests in {total_concurrent_time:.2f}s (avg: {avg_concurrent_time:.2f}s)",
         "passed": concurrent_success_rate >= 0.8,
         "status": "✅ PASSED" if concurrent_success_rate >= 0.8 else "❌ FAILED",
         "details": {
@@ -240,54 +376,29 @@ def test_enterprise_features() -> Dict[str, Any]:
     
     logger.info("🏢 Testing enterprise features...")
     
-    enterprise_tests = [
-        {"name": "Business Rules Engine", "feature": "business_rules"},
-        {"name": "Quality Gates", "feature": "quality_gates"},
-        {"name": "Workflow Monitoring", "feature": "monitoring"},
-        {"name": "Error Handling", "feature": "error_handling"},
-        {"name": "Audit Logging", "feature": "audit_logging"}
-    ]
-    
-    results = {
-        "features_tested": len(enterprise_tests),
+    results: Dict[str, Any] = {
+        "features_tested": len(_ENTERPRISE_TESTS),
         "features_working": 0,
         "feature_results": []
     }
     
     # Test enterprise request with all features
-    enterprise_request = """
-    Implement a comprehensive enterprise user management system with the following requirements:
-    
-    FUNCTIONAL REQUIREMENTS:
-    - Multi-tenant user provisioning and deprovisioning
-    - Integration with Active Directory and LDAP
-    - Role-based access control with granular permissions
-    - Single Sign-On (SSO) with SAML 2.0 and OAuth 2.0
-    - User lifecycle management with automated workflows
-    
-    NON-FUNCTIONAL REQUIREMENTS:
-    - GDPR and SOC 2 compliance
-    - 99.9% uptime SLA requirement
-    - Support for 10,000+ concurrent users
-    - Response time <500ms for authentication
-    - Comprehensive audit logging and monitoring
-    
-    SECURITY REQUIREMENTS:
-    - Multi-factor authentication (MFA)
-    - Password policy enforcement
-    - Session management with automatic timeout
-    - Encryption at rest and in transit
-    - Regular security vulnerability assessments
-    """
-    
     logger.info("Testing enterprise request with full feature validation...")
     
     try:
-        result = create_jira_ticket_with_ai(enterprise_request)
+        result = _cached_call(_ENTERPRISE_REQUEST)
+        
+        # Extract the result sections once for all feature checks
+        workflow_metadata = result.get("workflow_metadata") or {}
+        agent_interactions = workflow_metadata.get("agent_interactions") or []
+        agent_names = {interaction.get("agent") for interaction in agent_interactions}
+        interaction_count = len(agent_interactions)
+        quality_metrics = result.get("quality_metrics") or {}
+        agent_execution_times = (result.get("workflow_statistics") or {}).get("agent_execution_times") or {}
         
         # Test each enterprise feature based on the result
-        for test in enterprise_tests:
-            feature_result = {
+        for test in _ENTERPRISE_TESTS:
+            feature_result: Dict[str, Any] = {
                 "name": test["name"],
                 "feature": test["feature"],
                 "working": False,
@@ -296,18 +407,12 @@ def test_enterprise_features() -> Dict[str, Any]:
             
             if test["feature"] == "business_rules":
                 # Check if business rules were applied
-                workflow_metadata = result.get("workflow_metadata", {})
-                agent_interactions = workflow_metadata.get("agent_interactions", [])
-                business_rules_applied = any(
-                    interaction.get("agent") == "Business Rules Engine" 
-                    for interaction in agent_interactions
-                )
+                business_rules_applied = "Business Rules Engine" in agent_names
                 feature_result["working"] = business_rules_applied
                 feature_result["details"] = "Business rules engine processed the request"
                 
             elif test["feature"] == "quality_gates":
                 # Check quality score and threshold compliance
-                quality_metrics = result.get("quality_metrics", {})
                 final_score = quality_metrics.get("final_quality_score", 0)
                 threshold_met = quality_metrics.get("quality_threshold_met", False)
                 feature_result["working"] = final_score >= 0.8 and threshold_met
@@ -315,10 +420,9 @@ def test_enterprise_features() -> Dict[str, Any]:
                 
             elif test["feature"] == "monitoring":
                 # Check workflow statistics and monitoring
-                workflow_stats = result.get("workflow_statistics", {})
-                has_monitoring = bool(workflow_stats.get("agent_execution_times", {}))
+                has_monitoring = bool(agent_execution_times)
                 feature_result["working"] = has_monitoring
-                feature_result["details"] = f"Execution tracking: {len(workflow_stats.get('agent_execution_times', {}))  } agents monitored"
+                feature_result["details"] = f"Execution tracking: {len(agent_execution_times)} agents monitored"
                 
             elif test["feature"] == "error_handling":
                 # Check success and error handling
@@ -329,10 +433,9 @@ def test_enterprise_features() -> Dict[str, Any]:
                 
             elif test["feature"] == "audit_logging":
                 # Check workflow metadata and tracking
-                workflow_metadata = result.get("workflow_metadata", {})
-                has_audit_trail = bool(workflow_metadata.get("agent_interactions", []))
+                has_audit_trail = interaction_count > 0
                 feature_result["working"] = has_audit_trail
-                feature_result["details"] = f"Audit trail: {len(workflow_metadata.get('agent_interactions', []))} interactions logged"
+                feature_result["details"] = f"Audit trail: {interaction_count} interactions logged"
             
             feature_result["status"] = "✅ WORKING" if feature_result["working"] else "❌ NOT WORKING"
             results["feature_results"].append(feature_result)
@@ -341,8 +444,8 @@ def test_enterprise_features() -> Dict[str, Any]:
                 results["features_working"] += 1
     
     except Exception as e:
-        logger.error(f"Enterprise feature test failed: {e}")
-        for test in enterprise_tests:
+        logger.error("Enterprise feature test failed: %s", e)
+        for test in _ENTERPRISE_TESTS:
             results["feature_results"].append({
                 "name": test["name"],
                 "feature": test["feature"],
@@ -358,15 +461,19 @@ def test_enterprise_features() -> Dict[str, Any]:
 def run_production_deployment_test() -> Dict[str, Any]:
     """Run comprehensive production deployment test"""
     
-    print("🚀 PM Jira Agent - Production Deployment Test")
-    print("=" * 70)
-    print(f"Test started at: {datetime.now().isoformat()}")
-    print(f"Environment: Production-Ready Multi-Agent System")
-    print(f"Version: Enhanced Phase 3 Complete")
-    print()
+    # Console output is buffered and written between suites, outside the timed sections
+    buf = io.StringIO()
+    
+    print("🚀 PM Jira Agent - Production Deployment Test", file=buf)
+    print("=" * 70, file=buf)
+    print(f"Test started at: {datetime.now().isoformat()}", file=buf)
+    print(f"Environment: Production-Ready Multi-Agent System", file=buf)
+    print(f"Version: Enhanced Phase 3 Complete", file=buf)
+    print(file=buf)
+    _flush_output(buf)
     
     # Initialize results
-    test_results = {
+    test_results: Dict[str, Any] = {
         "test_timestamp": datetime.now().isoformat(),
         "test_duration": 0,
         "test_suites": {},
@@ -374,71 +481,71 @@ def run_production_deployment_test() -> Dict[str, Any]:
         "production_ready": False
     }
     
-    start_time = time.time()
+    start_time = time.perf_counter()
+    
+    # Start a fresh results stream for this run
+    open(RESULTS_STREAM_FILE, "w").close()
     
     # Test Suite 1: Complex Scenarios
-    print("🎯 Test Suite 1: Complex Real-World Scenarios")
-    print("-" * 50)
+    print("🎯 Test Suite 1: Complex Real-World Scenarios", file=buf)
+    print("-" * 50, file=buf)
     complex_results = test_complex_scenarios()
     test_results["test_suites"]["complex_scenarios"] = complex_results
+    _stream_suite_result("complex_scenarios", complex_results)
     
-    print(f"Scenarios: {complex_results['scenarios_passed']}/{complex_results['scenarios_tested']} passed")
-    print(f"Success Rate: {complex_results['success_rate']:.1f}%")
-    print(f"Avg Quality Score: {complex_results['performance_metrics'].get('avg_quality_score', 'N/A')}")
-    print(f"Total Time: {complex_results['performance_metrics']['total_time']}s")
-    print()
+    print(f"Scenarios: {complex_results['scenarios_passed']}/{complex_results['scenarios_tested']} passed", file=buf)
+    print(f"Success Rate: {complex_results['success_rate']:.1f}%", file=buf)
+    print(f"Avg Quality Score: {complex_results['performance_metrics'].get('avg_quality_score', 'N/A')}", file=buf)
+    print(f"Total Time: {complex_results['performance_metrics']['total_time']}s", file=buf)
+    print(file=buf)
+    _flush_output(buf)
     
     # Test Suite 2: Performance Benchmarks
-    print("⚡ Test Suite 2: Performance Benchmarks")
-    print("-" * 50)
+    print("⚡ Test Suite 2: Performance Benchmarks", file=buf)
+    print("-" * 50, file=buf)
     performance_results = test_performance_benchmarks()
     test_results["test_suites"]["performance_benchmarks"] = performance_results
+    _stream_suite_result("performance_benchmarks", performance_results)
     
-    print(f"Benchmarks: {performance_results['benchmarks_passed']}/{performance_results['benchmarks_tested']} passed")
-    print(f"Success Rate: {performance_results['success_rate']:.1f}%")
+    print(f"Benchmarks: {performance_results['benchmarks_passed']}/{performance_results['benchmarks_tested']} passed", file=buf)
+    print(f"Success Rate: {performance_results['success_rate']:.1f}%", file=buf)
     
     for benchmark in performance_results["benchmark_results"]:
-        print(f"  {benchmark['status']} {benchmark['name']}: {benchmark['actual']} (target: {benchmark['target']})")
-    print()
+        print(f"  {benchmark['status']} {benchmark['name']}: {benchmark['actual']} (target: {benchmark['target']})", file=buf)
+    print(file=buf)
+    _flush_output(buf)
     
     # Test Suite 3: Enterprise Features
-    print("🏢 Test Suite 3: Enterprise Features")
-    print("-" * 50)
+    print("🏢 Test Suite 3: Enterprise Features", file=buf)
+    print("-" * 50, file=buf)
     enterprise_results = test_enterprise_features()
     test_results["test_suites"]["enterprise_features"] = enterprise_results
+    _stream_suite_result("enterprise_features", enterprise_results)
     
-    print(f"Features: {enterprise_results['features_working']}/{enterprise_results['features_tested']} working")
-    print(f"Success Rate: {enterprise_results['success_rate']:.1f}%")
+    print(f"Features: {enterprise_results['features_working']}/{enterprise_results['features_tested']} working", file=buf)
+    print(f"Success Rate: {enterprise_results['success_rate']:.1f}%", file=buf)
     
     for feature in enterprise_results["feature_results"]:
-        print(f"  {feature['status']} {feature['name']}: {feature['details']}")
-    print()
+        print(f"  {feature['status']} {feature['name']}: {feature['details']}", file=buf)
+    print(file=buf)
+    _flush_output(buf)
     
     # Calculate overall results
-    test_results["test_duration"] = round(time.time() - start_time, 2)
+    test_results["test_duration"] = round(time.perf_counter() - start_time, 2)
     
     # Calculate overall success rate
-    total_tests = (
-        complex_results["scenarios_tested"] + 
-        performance_results["benchmarks_tested"] + 
-        enterprise_results["features_tested"]
-    )
-    total_passed = (
-        complex_results["scenarios_passed"] + 
-        performance_results["benchmarks_passed"] + 
-        enterprise_results["features_working"]
-    )
+    suites = test_results["test_suites"]
+    total_tests = sum(suites[name][tested_key] for name, tested_key, _, _ in SUITES)
+    total_passed = sum(suites[name][passed_key] for name, _, passed_key, _ in SUITES)
     
     overall_success_rate = (total_passed / total_tests) * 100
     test_results["overall_success_rate"] = overall_success_rate
     
     # Determine production readiness
     production_criteria = {
-        "complex_scenarios": complex_results["success_rate"] >= 75,
-        "performance_benchmarks": performance_results["success_rate"] >= 75,
-        "enterprise_features": enterprise_results["success_rate"] >= 80,
-        "overall_success": overall_success_rate >= 75
+        name: suites[name]["success_rate"] >= threshold for name, _, _, threshold in SUITES
     }
+    production_criteria["overall_success"] = overall_success_rate >= 75
     
     test_results["production_criteria"] = production_criteria
     test_results["production_ready"] = all(production_criteria.values())
@@ -451,55 +558,64 @@ def run_production_deployment_test() -> Dict[str, Any]:
         test_results["overall_status"] = "NEEDS IMPROVEMENT"
     
     # Print final summary
-    print("📋 Production Deployment Test Summary")
-    print("=" * 70)
-    print(f"Overall Success Rate: {overall_success_rate:.1f}%")
-    print(f"Production Status: {test_results['overall_status']}")
-    print(f"Test Duration: {test_results['test_duration']} seconds")
-    print()
-    
-    print("🔍 Production Criteria:")
+    print("📋 Production Deployment Test Summary", file=buf)
+    print("=" * 70, file=buf)
+    print(f"Overall Success Rate: {overall_success_rate:.1f}%", file=buf)
+    print(f"Production Status: {test_results['overall_status']}", file=buf)
+    print(f"Test Duration: {test_results['test_duration']} seconds", file=buf)
+    print(file=buf)
+    
+    print("🔍 Production Criteria:", file=buf)
     for criterion, passed in production_criteria.items():
         status_icon = "✅" if passed else "❌"
-        print(f"  {status_icon} {criterion.replace('_', ' ').title()}: {'PASSED' if passed else 'FAILED'}")
-    print()
+        print(f"  {status_icon} {criterion.replace('_', ' ').title()}: {'PASSED' if passed else 'FAILED'}", file=buf)
+    print(file=buf)
     
     if test_results["production_ready"]:
-        print("🎉 SYSTEM IS PRODUCTION READY!")
-        print("✅ All critical criteria met")
-        print("✅ Enterprise-grade functionality confirmed")
-        print("✅ Performance benchmarks achieved")
-        print("✅ Complex scenario handling validated")
-        print()
-        print("🚀 Ready for:")
-        print("  • Production deployment")
-        print("  • Enterprise customer usage")
-        print("  • High-volume workloads")
-        print("  • Mission-critical operations")
+        print("🎉 SYSTEM IS PRODUCTION READY!", file=buf)
+        print("✅ All critical criteria met", file=buf)
+        print("✅ Enterprise-grade functionality confirmed", file=buf)
+        print("✅ Performance benchmarks achieved", file=buf)
+        print("✅ Complex scenario handling validated", file=buf)
+        print(file=buf)
+        print("🚀 Ready for:", file=buf)
+        print("  • Production deployment", file=buf)
+        print("  • Enterprise customer usage", file=buf)
+        print("  • High-volume workloads", file=buf)
+        print("  • Mission-critical operations", file=buf)
     else:
-        print("⚠️ SYSTEM NEEDS IMPROVEMENT")
-        print("Some production criteria not met")
-        print("Review failed tests and implement fixes")
+        print("⚠️ SYSTEM NEEDS IMPROVEMENT", file=buf)
+        print("Some production criteria not met", file=buf)
+        print("Review failed tests and implement fixes", file=buf)
     
-    print()
+    print(file=buf)
     
     # Save results
-    with open("production_deployment_test_results.json", "w") as f:
-        json.dump(test_results, f, indent=2)
+    if ORJSON_AVAILABLE:
+        with open("production_deployment_test_results.json", "wb") as f:
+            f.write(orjson.dumps(test_results, option=orjson.OPT_INDENT_2))
+    else:
+        with open("production_deployment_test_results.json", "w") as f:
+            json.dump(test_results, f, indent=2)
     
-    print("💾 Detailed results saved to production_deployment_test_results.json")
+    print("💾 Detailed results saved to production_deployment_test_results.json", file=buf)
+    print(f"💾 Per-suite results streamed to {RESULTS_STREAM_FILE}", file=buf)
+    _flush_output(buf)
     
     return test_results
 
-def main():
+def main() -> None:
     """Main production test function"""
     
-    # Run production deployment test
-    results = run_production_deployment_test()
+    global _session
+    
+    # Run production deployment test, reusing one orchestrator across all suites
+    with orchestrator_session() as _session:
+        results = run_production_deployment_test()
     
     # Exit with appropriate code
     success = results["production_ready"]
-    exit(0 if success else 1)
+    sys.exit(0 if success else 1)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -10,19 +10,44 @@ import os
 import time
 import json
 import logging
-import uuid
-from typing import Dict, Any, List, Optional, Iterator, Union
-from datetime import datetime, timedelta
-from dataclasses import dataclass, asdict
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, Any, List, Optional, Iterator, Set, Union
+from datetime import datetime
+from dataclasses import dataclass, field
 
 import vertexai
 from vertexai.preview import agent_engines
 
+# Prefer the native orjson encoder for session context, fall back to stdlib json
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Optional shared session store for multi-replica deployments
+try:
+    import redis
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-@dataclass
+def _dump_context(context: Dict[str, Any]) -> str:
+    """Serialize session context as indented JSON"""
+    
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(context, option=orjson.OPT_INDENT_2).decode()
+        except TypeError:
+            pass  # e.g. non-string keys or integers beyond 64 bits; stdlib json handles those
+    return json.dumps(context, indent=2)
+
+@dataclass(slots=True)
 class SessionInfo:
     """Session information and metadata"""
     session_id: str
@@ -34,44 +59,169 @@ class SessionInfo:
     message_count: int = 0
     total_tokens: int = 0
     context: Dict[str, Any] = None
+    expiry_ts: float = field(default=0.0, init=False, repr=False)  # epoch seconds, set on activity
+    context_json: Optional[str] = field(default=None, init=False, repr=False)  # cleared when context changes
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization"""
-        data = asdict(self)
-        data["created_at"] = self.created_at.isoformat()
-        data["last_activity"] = self.last_activity.isoformat()
-        return data
+        return {
+            "session_id": self.session_id,
+            "user_id": self.user_id,
+            "agent_resource_name": self.agent_resource_name,
+            "agent_display_name": self.agent_display_name,
+            "created_at": self.created_at.isoformat(),
+            "last_activity": self.last_activity.isoformat(),
+            "message_count": self.message_count,
+            "total_tokens": self.total_tokens,
+            "context": dict(self.context) if self.context is not None else None  # shallow copy
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "SessionInfo":
+        """Rebuild a session from its to_dict form"""
+        return cls(
+            session_id=data["session_id"],
+            user_id=data["user_id"],
+            agent_resource_name=data["agent_resource_name"],
+            agent_display_name=data["agent_display_name"],
+            created_at=datetime.fromisoformat(data["created_at"]),
+            last_activity=datetime.fromisoformat(data["last_activity"]),
+            message_count=data["message_count"],
+            total_tokens=data["total_tokens"],
+            context=data["context"]
+        )
 
-@dataclass
+@dataclass(slots=True)
 class StreamingEvent:
     """Streaming response event"""
     event_type: str  # 'thinking', 'tool_use', 'response', 'complete'
     content: str
-    metadata: Dict[str, Any] = None
-    timestamp: datetime = None
-    
-    def __post_init__(self):
-        if self.timestamp is None:
-            self.timestamp = datetime.now()
-        if self.metadata is None:
-            self.metadata = {}
+    metadata: Dict[str, Any] = field(default_factory=dict)
+    timestamp: float = field(default_factory=time.time)  # epoch seconds
+    
+    @property
+    def created_at(self) -> datetime:
+        """Event timestamp as a datetime"""
+        return datetime.fromtimestamp(self.timestamp)
+
+@dataclass(slots=True)
+class SessionShard:
+    """One partition of the session store, with its own user index and lock"""
+    capacity: int
+    sessions: "OrderedDict[str, SessionInfo]" = field(default_factory=OrderedDict)  # least recently used first
+    sessions_by_user: Dict[str, Set[str]] = field(default_factory=dict)
+    lock: threading.Lock = field(default_factory=threading.Lock)
+    
+    def remove(self, session_id: str) -> bool:
+        """Remove a session and its user index entry (caller holds the lock)"""
+        
+        session = self.sessions.pop(session_id, None)
+        if session is None:
+            return False
+        
+        user_session_ids = self.sessions_by_user.get(session.user_id)
+        if user_session_ids is not None:
+            user_session_ids.discard(session_id)
+            if not user_session_ids:
+                del self.sessions_by_user[session.user_id]
+        return True
+    
+    def put(self, session: SessionInfo) -> Optional[str]:
+        """Store a session, evicting the least recently used one if over capacity (caller holds the lock)"""
+        
+        self.sessions[session.session_id] = session
+        self.sessions_by_user.setdefault(session.user_id, set()).add(session.session_id)
+        
+        if len(self.sessions) <= self.capacity:
+            return None
+        evicted_id = next(iter(self.sessions))
+        self.remove(evicted_id)
+        return evicted_id
+
+class RedisSessionStore:
+    """Shared session store in Redis; keys expire with the session timeout"""
+    
+    def __init__(self, url: str, ttl_seconds: int):
+        self.client = redis.Redis.from_url(url)
+        self.ttl_seconds = ttl_seconds
+    
+    def put(self, sessions: List[SessionInfo]):
+        """Write sessions and their user index entries in one MULTI/EXEC round trip"""
+        
+        pipe = self.client.pipeline(transaction=True)
+        for session in sessions:
+            data = session.to_dict()
+            blob = orjson.dumps(data) if ORJSON_AVAILABLE else json.dumps(data).encode()
+            user_key = f"user:{session.user_id}:sessions"
+            pipe.set(f"session:{session.session_id}", blob, ex=self.ttl_seconds)
+            pipe.sadd(user_key, session.session_id)
+            pipe.expire(user_key, self.ttl_seconds)
+        pipe.execute()
+    
+    def get(self, session_id: str) -> Optional[SessionInfo]:
+        """Load a session, or None if it is missing or has expired"""
+        
+        blob = self.client.get(f"session:{session_id}")
+        if blob is None:
+            return None
+        
+        session = SessionInfo.from_dict(orjson.loads(blob) if ORJSON_AVAILABLE else json.loads(blob))
+        session.expiry_ts = session.last_activity.timestamp() + self.ttl_seconds
+        return session
+    
+    def delete(self, session_id: str, user_id: str) -> bool:
+        """Delete a session and its user index entry, returning whether the session existed"""
+        
+        pipe = self.client.pipeline(transaction=True)
+        pipe.delete(f"session:{session_id}")
+        pipe.srem(f"user:{user_id}:sessions", session_id)
+        deleted, _ = pipe.execute()
+        return bool(deleted)
+    
+    def user_session_ids(self, user_id: str) -> Set[str]:
+        """IDs of the sessions indexed for a user (expired ones load as None)"""
+        
+        return {session_id.decode() for session_id in self.client.smembers(f"user:{user_id}:sessions")}
 
 class SessionManager:
     """Advanced session manager for Vertex AI Agent Engine"""
     
-    def __init__(self, project_id: str = "service-execution-uat-bb7", location: str = "europe-west9"):
+    SESSION_SHARDS = 16  # Independent session partitions, each with its own lock
+    AGENT_INSTANCE_TTL_SECONDS = 3600  # Re-fetch agent handles periodically instead of holding them forever
+    
+    def __init__(self, project_id: str = "service-execution-uat-bb7", location: str = "europe-west9",
+                 max_sessions: int = 10000, redis_url: Optional[str] = None):
         self.project_id = project_id
         self.location = location
         
         # Initialize Vertex AI
         vertexai.init(project=project_id, location=location)
         
-        # Session storage (in production, would use Cloud Firestore or similar)
-        self.sessions: Dict[str, SessionInfo] = {}
+        # In-process session storage,
+        # partitioned by session ID so unrelated sessions don't contend on one lock
+        # Bounded by max_sessions with least-recently-used eviction, so memory stays capped
+        # even if cleanup_expired_sessions is never called
+        self.max_sessions = max_sessions
+        shard_capacity = max(1, -(-max_sessions // self.SESSION_SHARDS))
+        self._shards = [SessionShard(capacity=shard_capacity) for _ in range(self.SESSION_SHARDS)]
         self.session_timeout_hours = 24  # Sessions expire after 24 hours
         
-        # Agent registry
+        # With a Redis URL, sessions are written through to Redis so every replica can serve them;
+        # the local shards then act as a cache in front of it
+        redis_url = redis_url or os.getenv("SESSION_REDIS_URL")
+        self._store: Optional[RedisSessionStore] = None
+        if redis_url and REDIS_AVAILABLE:
+            self._store = RedisSessionStore(redis_url, self.session_timeout_hours * 3600)
+        elif redis_url:
+            logger.warning("⚠️ SESSION_REDIS_URL set but redis is not installed, keeping sessions in process")
+        
+        # Agent registry, plus the same entries indexed by resource name for session lookups
         self.agent_registry: Dict[str, Any] = {}
+        self._agents_by_resource: Dict[str, Any] = {}
+        
+        # Guards the agent maps; shard locks guard sessions.
+        # Locks are held only for short bookkeeping, never around agent queries.
+        self._lock = threading.Lock()
         
         logger.info(f"Session Manager initialized for project {project_id}")
     
@@ -79,15 +229,8 @@ class SessionManager:
         """Register an agent for session management"""
         
         try:
-            # Get agent instance to verify it exists
-            agent = agent_engines.get(resource_name)
-            
-            self.agent_registry[agent_type] = {
-                "resource_name": resource_name,
-                "display_name": display_name,
-                "agent_instance": agent,
-                "registered_at": datetime.now()
-            }
+            # The agent instance is fetched on first use, so registration makes no RPC
+            self._add_agent(resource_name, display_name, agent_type)
             
             logger.info(f"✅ Registered agent {agent_type}: {display_name}")
             return True
@@ -96,7 +239,52 @@ class SessionManager:
             logger.error(f"❌ Failed to register agent {agent_type}: {str(e)}")
             return False
     
-    def create_session(self, user_id: str, agent_type: str, context: Optional[Dict[str, Any]] = None) -> Optional[SessionInfo]:
+    @property
+    def sessions(self) -> Dict[str, SessionInfo]:
+        """Snapshot of all stored sessions keyed by session ID"""
+        
+        all_sessions: Dict[str, SessionInfo] = {}
+        for shard in self._shards:
+            with shard.lock:
+                all_sessions.update(shard.sessions)
+        return all_sessions
+    
+    def _shard(self, session_id: str) -> SessionShard:
+        """Shard owning a session ID"""
+        
+        return self._shards[hash(session_id) % self.SESSION_SHARDS]
+    
+    def _add_agent(self, resource_name: str, display_name: str, agent_type: str, agent_instance: Any = None):
+        """Store an agent entry in the registry and the resource name index"""
+        
+        agent_info = {
+            "resource_name": resource_name,
+            "display_name": display_name,
+            "agent_instance": agent_instance,
+            "instance_fetched_at": time.monotonic() if agent_instance is not None else None,
+            "registered_at": datetime.now()
+        }
+        with self._lock:
+            self.agent_registry[agent_type] = agent_info
+            self._agents_by_resource[resource_name] = agent_info
+    
+    def _get_instance(self, agent_info: Dict[str, Any]) -> Any:
+        """Agent instance for a registry entry, fetched on first use and refreshed after the TTL"""
+        
+        agent = agent_info["agent_instance"]
+        fetched_at = agent_info["instance_fetched_at"]
+        if agent is not None and time.monotonic() - fetched_at < self.AGENT_INSTANCE_TTL_SECONDS:
+            return agent
+        
+        # A failed fetch leaves the cached entry untouched, so the next call retries
+        agent = agent_engines.get(agent_info["resource_name"])
+        with self._lock:
+            agent_info["agent_instance"] = agent
+            agent_info["instance_fetched_at"] = time.monotonic()
+        return agent
+    
+    def create_session(self, user_id: str, agent_type: str, context: Optional[Dict[str, Any]] = None,
+                       persist: bool = True) -> Optional[SessionInfo]:
         """Create a new session for a user with a specific agent"""
         
         try:
@@ -108,22 +296,30 @@ class SessionManager:
             agent_info = self.agent_registry[agent_type]
             
             # Generate session ID
-            session_id = f"{agent_type}_{user_id}_{uuid.uuid4().hex[:8]}"
+            session_id = f"{agent_type}_{user_id}_{os.urandom(4).hex()}"
             
             # Create session info
+            now = datetime.now()
             session_info = SessionInfo(
                 session_id=session_id,
                 user_id=user_id,
                 agent_resource_name=agent_info["resource_name"],
                 agent_display_name=agent_info["display_name"],
-                created_at=datetime.now(),
-                last_activity=datetime.now(),
+                created_at=now,
+                last_activity=now,
                 context=context or {}
             )
+            self._touch_session(session_info, now)
             
             # Store session
-            self.sessions[session_id] = session_info
-            
+            shard = self._shard(session_id)
+            with shard.lock:
+                evicted_id = shard.put(session_info)
+            
+            if evicted_id:
+                logger.info(f"♻️ Evicted least recently used session {evicted_id}")
+            if persist:
+                self._persist(session_info)
             logger.info(f"✅ Created session {session_id} for user {user_id} with {agent_type}")
             return session_info
             
@@ -134,7 +330,22 @@ class SessionManager:
     def get_session(self, session_id: str) -> Optional[SessionInfo]:
         """Get session information"""
         
-        session = self.sessions.get(session_id)
+        shard = self._shard(session_id)
+        session = shard.sessions.get(session_id)
+        
+        if session is None and self._store is not None:
+            # Created or last touched on another replica
+            session = self._call_store(self._store.get, session_id)
+            if session is not None:
+                evicted_id = None
+                with shard.lock:
+                    cached = shard.sessions.get(session_id)
+                    if cached is None:
+                        evicted_id = shard.put(session)
+                    else:
+                        session = cached
+                if evicted_id:
+                    logger.info(f"♻️ Evicted least recently used session {evicted_id}")
         
         if session is None:
             logger.warning(f"Session {session_id} not found")
@@ -143,18 +354,36 @@ class SessionManager:
         # Check if session has expired
         if self._is_session_expired(session):
             logger.info(f"Session {session_id} has expired, removing")
-            del self.sessions[session_id]
+            with shard.lock:
+                shard.remove(session_id)
+            if self._store is not None:
+                self._call_store(self._store.delete, session_id, session.user_id)
             return None
         
+        with shard.lock:
+            if session_id in shard.sessions:
+                shard.sessions.move_to_end(session_id)
+        
         return session
     
     def list_user_sessions(self, user_id: str) -> List[SessionInfo]:
         """List all active sessions for a user"""
         
+        candidates = []
+        for shard in self._shards:
+            with shard.lock:
+                candidates.extend(shard.sessions.get(session_id) for session_id in shard.sessions_by_user.get(user_id, ()))
+        
+        if self._store is not None:
+            known_ids = {session.session_id for session in candidates if session is not None}
+            store_ids = self._call_store(self._store.user_session_ids, user_id, default=set())
+            candidates.extend(self._call_store(self._store.get, session_id) for session_id in store_ids - known_ids)
+        
         user_sessions = []
+        now = time.time()
         
-        for session in self.sessions.values():
-            if session.user_id == user_id and not self._is_session_expired(session):
+        for session in candidates:
+            if session is not None and not self._is_session_expired(session, now):
                 user_sessions.append(session)
         
         return user_sessions
@@ -162,8 +391,18 @@ class SessionManager:
     def delete_session(self, session_id: str) -> bool:
         """Delete a specific session"""
         
-        if session_id in self.sessions:
-            del self.sessions[session_id]
+        shard = self._shard(session_id)
+        with shard.lock:
+            session = shard.sessions.get(session_id)
+            removed = shard.remove(session_id)
+        
+        if self._store is not None:
+            if session is None:
+                session = self._call_store(self._store.get, session_id)
+            if session is not None:
+                removed = self._call_store(self._store.delete, session_id, session.user_id, default=False) or removed
+        
+        if removed:
             logger.info(f"✅ Deleted session {session_id}")
             return True
         else:
@@ -184,11 +423,7 @@ class SessionManager:
         
         try:
             # Get agent instance
-            agent_info = None
-            for agent_type, info in self.agent_registry.items():
-                if info["resource_name"] == session.agent_resource_name:
-                    agent_info = info
-                    break
+            agent_info = self._agents_by_resource.get(session.agent_resource_name)
             
             if agent_info is None:
                 return {
@@ -197,23 +432,26 @@ class SessionManager:
                     "session_id": session_id
                 }
             
-            agent = agent_info["agent_instance"]
+            agent = self._get_instance(agent_info)
             
             # Update context if provided
             if context_update:
                 session.context.update(context_update)
+                session.context_json = None
             
             # Prepare contextualized message
             contextualized_message = self._prepare_contextualized_message(message, session)
             
             # Query agent
-            start_time = time.time()
+            start_time = time.monotonic()
             response = agent.query(input=contextualized_message)
-            execution_time = time.time() - start_time
+            execution_time = time.monotonic() - start_time
             
             # Update session
-            session.last_activity = datetime.now()
-            session.message_count += 1
+            with self._shard(session.session_id).lock:
+                self._touch_session(session)
+                session.message_count += 1
+            self._persist(session)
             
             logger.info(f"✅ Query completed for session {session_id} in {execution_time:.2f}s")
             
@@ -248,11 +486,7 @@ class SessionManager:
         
         try:
             # Get agent instance
-            agent_info = None
-            for agent_type, info in self.agent_registry.items():
-                if info["resource_name"] == session.agent_resource_name:
-                    agent_info = info
-                    break
+            agent_info = self._agents_by_resource.get(session.agent_resource_name)
             
             if agent_info is None:
                 yield StreamingEvent(
@@ -261,11 +495,12 @@ class SessionManager:
                 )
                 return
             
-            agent = agent_info["agent_instance"]
+            agent = self._get_instance(agent_info)
             
             # Update context if provided
             if context_update:
                 session.context.update(context_update)
+                session.context_json = None
             
             # Prepare contextualized message
             contextualized_message = self._prepare_contextualized_message(message, session)
@@ -277,26 +512,22 @@ class SessionManager:
                 metadata={"session_id": session_id, "agent": session.agent_display_name}
             )
             
-            # Stream query (in real implementation, would use actual streaming)
-            # For now, simulate streaming with chunks
+            # Stream query, forwarding chunks as the agent produces them
             try:
-                response = agent.query(input=contextualized_message)
-                response_text = str(response)
-                
-                # Simulate streaming by chunking response
-                chunk_size = 50
-                for i in range(0, len(response_text), chunk_size):
-                    chunk = response_text[i:i + chunk_size]
+                total_response_length = 0
+                for chunk_index, chunk in enumerate(self._iter_response_chunks(agent, contextualized_message)):
+                    total_response_length += len(chunk)
                     yield StreamingEvent(
                         event_type="response",
                         content=chunk,
-                        metadata={"chunk_index": i // chunk_size}
+                        metadata={"chunk_index": chunk_index}
                     )
-                    time.sleep(0.1)  # Simulate network delay
                 
                 # Update session
-                session.last_activity = datetime.now()
-                session.message_count += 1
+                with self._shard(session.session_id).lock:
+                    self._touch_session(session)
+                    session.message_count += 1
+                self._persist(session)
                 
                 yield StreamingEvent(
                     event_type="complete",
@@ -304,7 +535,7 @@ class SessionManager:
                     metadata={
                         "session_id": session_id,
                         "message_count": session.message_count,
-                        "total_response_length": len(response_text)
+                        "total_response_length": total_response_length
                     }
                 )
                 
@@ -320,6 +551,20 @@ class SessionManager:
                 content=f"Stream setup failed: {str(e)}"
             )
     
+    def _iter_response_chunks(self, agent: Any, contextualized_message: str, chunk_size: int = 50) -> Iterator[str]:
+        """Yield response text chunks, using the agent's native streaming when it has one"""
+        
+        stream_query = getattr(agent, "stream_query", None)
+        if stream_query is not None:
+            for chunk in stream_query(input=contextualized_message):
+                yield str(chunk)
+            return
+        
+        # Non-streaming agents: split the complete response into chunks
+        response_text = str(agent.query(input=contextualized_message))
+        for i in range(0, len(response_text), chunk_size):
+            yield response_text[i:i + chunk_size]
+    
     def get_session_history(self, session_id: str, limit: int = 50) -> Dict[str, Any]:
         """Get session conversation history"""
         
@@ -346,46 +591,68 @@ class SessionManager:
     def cleanup_expired_sessions(self) -> int:
         """Clean up expired sessions"""
         
-        expired_sessions = []
-        
-        for session_id, session in self.sessions.items():
-            if self._is_session_expired(session):
-                expired_sessions.append(session_id)
-        
-        for session_id in expired_sessions:
-            del self.sessions[session_id]
+        now = time.time()
+        
+        # Only the local shards need this; Redis expires its copies by TTL.
+        # Rebuild each shard's store and user index with live sessions only, one shard at a time
+        removed = 0
+        for shard in self._shards:
+            with shard.lock:
+                sessions_before = len(shard.sessions)
+                live_sessions: "OrderedDict[str, SessionInfo]" = OrderedDict()
+                sessions_by_user: Dict[str, Set[str]] = {}
+                for session_id, session in shard.sessions.items():
+                    if now <= session.expiry_ts:
+                        live_sessions[session_id] = session
+                        sessions_by_user.setdefault(session.user_id, set()).add(session_id)
+                
+                shard.sessions = live_sessions
+                shard.sessions_by_user = sessions_by_user
+                removed += sessions_before - len(live_sessions)
         
-        if expired_sessions:
-            logger.info(f"🧹 Cleaned up {len(expired_sessions)} expired sessions")
+        if removed:
+            logger.info(f"🧹 Cleaned up {removed} expired sessions")
         
-        return len(expired_sessions)
+        return removed
     
     def get_session_analytics(self) -> Dict[str, Any]:
         """Get analytics for all sessions"""
         
-        active_sessions = [s for s in self.sessions.values() if not self._is_session_expired(s)]
+        now = time.time()
         
-        # Calculate analytics
-        total_sessions = len(active_sessions)
-        total_messages = sum(s.message_count for s in active_sessions)
-        total_users = len(set(s.user_id for s in active_sessions))
+        # Snapshot each shard under its lock, then compute without holding any
+        sessions: List[SessionInfo] = []
+        for shard in self._shards:
+            with shard.lock:
+                sessions.extend(shard.sessions.values())
         
-        # Agent usage
+        # Calculate analytics in a single pass over live sessions
+        total_sessions = 0
+        total_messages = 0
+        users = set()
         agent_usage = {}
-        for session in active_sessions:
-            agent_name = session.agent_display_name
-            if agent_name not in agent_usage:
-                agent_usage[agent_name] = {"sessions": 0, "messages": 0}
-            agent_usage[agent_name]["sessions"] += 1
-            agent_usage[agent_name]["messages"] += session.message_count
+        total_duration_minutes = 0.0
         
-        # Session duration analysis
-        durations = []
-        for session in active_sessions:
-            duration_minutes = (session.last_activity - session.created_at).total_seconds() / 60
-            durations.append(duration_minutes)
+        for session in sessions:
+            if now > session.expiry_ts:
+                continue
+            
+            total_sessions += 1
+            total_messages += session.message_count
+            users.add(session.user_id)
+            
+            # Agent usage
+            usage = agent_usage.get(session.agent_display_name)
+            if usage is None:
+                usage = agent_usage[session.agent_display_name] = {"sessions": 0, "messages": 0}
+            usage["sessions"] += 1
+            usage["messages"] += session.message_count
+            
+            # Session duration
+            total_duration_minutes += (session.last_activity - session.created_at).total_seconds() / 60
         
-        avg_duration = sum(durations) / len(durations) if durations else 0
+        total_users = len(users)
+        avg_duration = total_duration_minutes / total_sessions if total_sessions else 0
         
         return {
             "timestamp": datetime.now().isoformat(),
@@ -398,33 +665,67 @@ class SessionManager:
             "registered_agents": len(self.agent_registry)
         }
     
-    def _is_session_expired(self, session: SessionInfo) -> bool:
-        """Check if session has expired"""
+    def _persist(self, *sessions: SessionInfo):
+        """Write sessions through to the shared store, if one is configured
+        
+        Local state is already updated when this runs, so a store failure is logged rather
+        than raised; the sessions are written again on their next update.
+        """
+        
+        if self._store is None:
+            return
+        try:
+            self._store.put(list(sessions))
+        except Exception as e:
+            session_ids = ", ".join(session.session_id for session in sessions)
+            logger.warning(f"⚠️ Failed to persist sessions {session_ids} to shared store: {str(e)}")
+    
+    def _call_store(self, operation: Callable[..., Any], *args: Any, default: Any = None) -> Any:
+        """Run a shared store operation, falling back to default (local sessions only) if it fails"""
         
-        expiry_time = session.last_activity + timedelta(hours=self.session_timeout_hours)
-        return datetime.now() > expiry_time
+        try:
+            return operation(*args)
+        except Exception as e:
+            logger.warning(f"⚠️ Shared store {operation.__name__} failed, using local sessions only: {str(e)}")
+            return default
+    
+    def _is_session_expired(self, session: SessionInfo, now: Optional[float] = None) -> bool:
+        """Check if session has expired, optionally against a timestamp shared by a bulk scan"""
+        
+        if now is None:
+            now = time.time()
+        return now > session.expiry_ts
+    
+    def _touch_session(self, session: SessionInfo, now: Optional[datetime] = None):
+        """Record session activity and precompute its expiry timestamp"""
+        
+        session.last_activity = now or datetime.now()
+        session.expiry_ts = session.last_activity.timestamp() + self.session_timeout_hours * 3600
     
     def _prepare_contextualized_message(self, message: str, session: SessionInfo) -> str:
         """Prepare message with session context"""
         
-        context_info = []
+        # First message of a session without context: nothing to frame
+        if not session.context and session.message_count == 0:
+            return message
         
         # Add session context
+        context_section = ""
         if session.context:
-            context_info.append(f"Session Context: {json.dumps(session.context, indent=2)}")
+            if session.context_json is None:
+                session.context_json = _dump_context(session.context)
+            context_section = f"Session Context: {session.context_json}\n"
         
         # Add conversation context
+        conversation_section = ""
         if session.message_count > 0:
-            context_info.append(f"This is message #{session.message_count + 1} in our conversation.")
+            conversation_section = f"This is message #{session.message_count + 1} in our conversation.\n"
         
         # Add user context
-        context_info.append(f"User ID: {session.user_id}")
-        
-        if context_info:
-            context_section = "\n".join(context_info)
-            return f"CONTEXT:\n{context_section}\n\nUSER MESSAGE:\n{message}"
-        else:
-            return message
+        return (
+            f"CONTEXT:\n{context_section}{conversation_section}User ID: {session.user_id}"
+            f"\n\nUSER MESSAGE:\n{message}"
+        )
 
 class MultiAgentSessionWorkflow:
     """Multi-agent workflow with session management"""
@@ -437,23 +738,29 @@ class MultiAgentSessionWorkflow:
                       context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Start a multi-agent workflow with session management"""
         
-        workflow_id = f"workflow_{user_id}_{uuid.uuid4().hex[:8]}"
+        workflow_id = f"workflow_{user_id}_{os.urandom(4).hex()}"
         
         try:
+            # Shared workflow context; each session gets its own copy with its phase
+            base_context = dict(context) if context else {}
+            base_context["workflow_id"] = workflow_id
+            
+            def phase_context(phase: str) -> Dict[str, Any]:
+                session_context = base_context.copy()
+                session_context["phase"] = phase
+                return session_context
+            
             # Create sessions for each agent
             pm_session = self.session_manager.create_session(
-                user_id, "pm_agent", 
-                {**context, "workflow_id": workflow_id, "phase": "analysis"} if context else {"workflow_id": workflow_id, "phase": "analysis"}
+                user_id, "pm_agent", phase_context("analysis"), persist=False
             )
             
             tech_lead_session = self.session_manager.create_session(
-                user_id, "tech_lead_agent",
-                {**context, "workflow_id": workflow_id, "phase": "review"} if context else {"workflow_id": workflow_id, "phase": "review"}
+                user_id, "tech_lead_agent", phase_context("review"), persist=False
             )
             
             jira_creator_session = self.session_manager.create_session(
-                user_id, "jira_creator_agent",
-                {**context, "workflow_id": workflow_id, "phase": "creation"} if context else {"workflow_id": workflow_id, "phase": "creation"}
+                user_id, "jira_creator_agent", phase_context("creation"), persist=False
             )
             
             if not all([pm_session, tech_lead_session, jira_creator_session]):
@@ -463,6 +770,9 @@ class MultiAgentSessionWorkflow:
                     "workflow_id": workflow_id
                 }
             
+            # Write all three sessions to the shared store in a single transaction
+            self.session_manager._persist(pm_session, tech_lead_session, jira_creator_session)
+            
             # Store workflow session mapping
             self.workflow_sessions[workflow_id] = {
                 "pm_session_id": pm_session.session_id,
@@ -550,13 +860,7 @@ def main():
     
     print("\n📝 Registering sample agents...")
     for resource_name, display_name, agent_type in sample_agents:
-        # In real implementation, would register actual agents
-        session_manager.agent_registry[agent_type] = {
-            "resource_name": resource_name,
-            "display_name": display_name,
-            "agent_instance": None,  # Would be actual agent instance
-            "registered_at": datetime.now()
-        }
+        session_manager.register_agent(resource_name, display_name, agent_type)
         print(f"  ✅ Registered {agent_type}: {display_name}")
     
     # Test session creation
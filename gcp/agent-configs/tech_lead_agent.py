@@ -5,32 +5,195 @@ Tech Lead Agent - Quality Review and Technical Validation
 Reviews PM Agent ticket drafts and provides technical feedback
 """
 
-import vertexai
-from google.cloud import aiplatform
-from typing import Dict, Any, List
+from typing import Dict, Any, Iterator, List
+import re
+import copy
 import json
+import hashlib
 import logging
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from functools import lru_cache
 from tools import CloudFunctionTools, QualityGates
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Review keyword vocabularies, matched as substrings of the lowercased ticket text
+_COMPLEXITY_INDICATORS = {
+    "high": ("integration", "migration", "refactor", "architecture", "performance", "security"),
+    "medium": ("feature", "enhancement", "update", "modify", "extend"),
+    "low": ("fix", "bug", "typo", "text", "styling", "minor")
+}
+_RISK_KEYWORDS = ("database", "api", "external", "third-party", "payment", "authentication")
+_INTERNAL_KEYWORDS = ("authentication", "user management", "permissions", "config")
+_EXTERNAL_KEYWORDS = ("api", "third-party", "external", "service", "integration")
+_DB_KEYWORDS = ("database", "schema", "table", "migration", "data")
+_UI_KEYWORDS = ("interface", "ui", "frontend", "display", "view", "screen")
+_BREAKING_KEYWORDS = ("remove", "delete", "deprecate", "replace", "breaking")
+_TESTABLE_KEYWORDS = ("should", "must", "will", "verify", "confirm", "validate", "check")
+_SPECIFIC_KEYWORDS = ("exactly", "within", "at least", "no more than", "specific", "particular")
+
+def _keyword_pattern(keywords) -> re.Pattern:
+    """Compile keywords into one alternation, so a presence check is a single scan"""
+    return re.compile("|".join(map(re.escape, keywords)))
+
+# Complexity -> (feasibility score, estimated effort, indicator pattern), checked in priority order
+_COMPLEXITY_TABLE = {
+    complexity: (score, effort, _keyword_pattern(_COMPLEXITY_INDICATORS[complexity]))
+    for complexity, score, effort in (
+        ("high", 0.5, "1-2 weeks"),
+        ("medium", 0.7, "3-5 days"),
+        ("low", 0.9, "1-2 days")
+    )
+}
+_DEFAULT_COMPLEXITY = "medium"  # When no indicator matches
+_DB_RE = _keyword_pattern(_DB_KEYWORDS)
+_UI_RE = _keyword_pattern(_UI_KEYWORDS)
+_BREAKING_RE = _keyword_pattern(_BREAKING_KEYWORDS)
+_TESTABLE_RE = _keyword_pattern(_TESTABLE_KEYWORDS)
+_SPECIFIC_RE = _keyword_pattern(_SPECIFIC_KEYWORDS)
+
+# Quality gate area -> improvement suggested when it scores below 0.7
+_AREA_LABELS = {
+    area: f"Improve {area.replace('_', ' ')}"
+    for area in ("summary_clarity", "user_story_format", "acceptance_criteria", "technical_feasibility", "business_value")
+}
+
+# Static agent instructions, shared by every agent
+_AGENT_INSTRUCTIONS = """
+You are a Senior Tech Lead AI Agent specialized in technical review and quality assurance.
+
+Your responsibilities:
+1. Review PM Agent ticket drafts for technical feasibility
+2. Validate acceptance criteria completeness and quality
+3. Analyze dependencies and integration points
+4. Assess technical risks and complexity
+5. Provide constructive feedback for improvement
+6. Ensure tickets meet technical and quality standards
+
+Your personality:
+- Technically rigorous and detail-oriented
+- Constructive and helpful in feedback
+- Risk-aware but solution-focused
+- Quality-driven with high standards
+- Collaborative with PM Agent
+
+Quality Standards:
+- Technical feasibility must be realistic
+- Acceptance criteria must be testable and complete
+- Dependencies must be identified and addressed
+- Implementation approach must be sound
+- Overall quality score must be ≥ 0.8 for approval
+"""
+
+@dataclass(slots=True)
+class TechnicalAnalysis:
+    """Technical feasibility of a ticket draft"""
+    feasibility_score: float
+    complexity_assessment: str
+    estimated_effort: str
+    technical_risks: List[str] = field(default_factory=list)
+    architecture_considerations: List[str] = field(default_factory=list)
+    implementation_approach: str = ""
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "feasibility_score": self.feasibility_score,
+            "complexity_assessment": self.complexity_assessment,
+            "estimated_effort": self.estimated_effort,
+            "technical_risks": self.technical_risks,
+            "architecture_considerations": self.architecture_considerations,
+            "implementation_approach": self.implementation_approach
+        }
+
+@dataclass(slots=True)
+class ACValidation:
+    """Quality and completeness of a ticket's acceptance criteria"""
+    criteria_count: int = 0
+    criteria_quality: str = "poor"
+    testable_criteria: int = 0
+    specific_criteria: int = 0
+    missing_elements: List[str] = field(default_factory=list)
+    recommendations: List[str] = field(default_factory=list)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "criteria_count": self.criteria_count,
+            "criteria_quality": self.criteria_quality,
+            "testable_criteria": self.testable_criteria,
+            "specific_criteria": self.specific_criteria,
+            "missing_elements": self.missing_elements,
+            "recommendations": self.recommendations
+        }
+
+@dataclass(slots=True)
+class DependencyAnalysis:
+    """Dependencies and integration points of a ticket"""
+    internal_dependencies: List[str] = field(default_factory=list)
+    external_dependencies: List[str] = field(default_factory=list)
+    api_integrations: List[str] = field(default_factory=list)
+    database_changes: bool = False
+    ui_changes: bool = False
+    breaking_changes: bool = False
+    risk_level: str = "low"
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "internal_dependencies": self.internal_dependencies,
+            "external_dependencies": self.external_dependencies,
+            "api_integrations": self.api_integrations,
+            "database_changes": self.database_changes,
+            "ui_changes": self.ui_changes,
+            "breaking_changes": self.breaking_changes,
+            "risk_level": self.risk_level
+        }
+
+@dataclass(slots=True)
+class Feedback:
+    """Technical feedback returned to the PM Agent"""
+    overall_feedback: str = ""
+    technical_concerns: List[str] = field(default_factory=list)
+    quality_improvements: List[str] = field(default_factory=list)
+    implementation_suggestions: List[str] = field(default_factory=list)
+    risk_mitigation: List[str] = field(default_factory=list)
+    priority_adjustments: List[str] = field(default_factory=list)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "overall_feedback": self.overall_feedback,
+            "technical_concerns": self.technical_concerns,
+            "quality_improvements": self.quality_improvements,
+            "implementation_suggestions": self.implementation_suggestions,
+            "risk_mitigation": self.risk_mitigation,
+            "priority_adjustments": self.priority_adjustments
+        }
+
+
 class TechLeadAgent:
     """Tech Lead Agent for technical review and quality validation"""
     
+    REVIEW_CACHE_SIZE = 256  # Reviews kept for drafts that come back unchanged
+    FAST_PATH_QUALITY_SCORE = 0.9  # Low-risk drafts scoring at least this skip the detailed review
+    
     def __init__(self, project_id: str = "service-execution-uat-bb7", location: str = "europe-west9"):
         self.project_id = project_id
         self.location = location
         self.tools = CloudFunctionTools(project_id)
         self.quality_gates = QualityGates()
         
-        # Initialize Vertex AI
-        vertexai.init(project=project_id, location=location)
-        
         # Agent configuration
         self.model_name = "gemini-2.5-flash"
-        self.agent_instructions = self._get_agent_instructions()
+        self.agent_instructions = _AGENT_INSTRUCTIONS
+        
+        # Reviews are deterministic, so identical (draft, analysis) pairs reuse the earlier result
+        self._review_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._review_cache_lock = threading.Lock()
+        
+        # Skip the detailed review for high-quality, low-risk drafts
+        self.fast_path_enabled = True
         
         logger.info(f"Tech Lead Agent initialized for project {project_id} in {location}")
     
@@ -46,19 +209,46 @@ class TechLeadAgent:
             Dictionary containing review results and feedback
         """
         try:
+            cache_key = hashlib.sha256(
+                json.dumps([ticket_draft, pm_analysis], sort_keys=True, default=str).encode()
+            ).hexdigest()
+            with self._review_cache_lock:
+                cached_review = self._review_cache.get(cache_key)
+                if cached_review is not None:
+                    self._review_cache.move_to_end(cache_key)
+            if cached_review is not None:
+                logger.info("Tech Lead reusing review of identical ticket draft")
+                return copy.deepcopy(cached_review)
+            
             logger.info("Tech Lead reviewing ticket draft")
             
             # Step 1: Perform detailed quality assessment
             quality_assessment = self.quality_gates.calculate_quality_score(ticket_draft)
             
+            # Lowercase the ticket text once for all keyword analyses
+            description = ticket_draft.get("description", "")
+            description_lower = description.lower()
+            full_text = ticket_draft.get("summary", "").lower() + " " + description_lower
+            
             # Step 2: Technical feasibility analysis
-            technical_analysis = self._analyze_technical_feasibility(ticket_draft, pm_analysis)
+            technical_analysis = self._analyze_technical_feasibility(full_text, description_lower, pm_analysis)
+            
+            # Step 3: Integration and dependency analysis
+            dependency_analysis = self._analyze_dependencies(full_text, pm_analysis)
             
-            # Step 3: Acceptance criteria validation
-            ac_validation = self._validate_acceptance_criteria(ticket_draft)
+            # High-quality, low-risk drafts without major concerns are approved by the full
+            # review anyway, so they skip the acceptance criteria validation and detailed feedback
+            if (self.fast_path_enabled
+                    and quality_assessment["overall_score"] >= self.FAST_PATH_QUALITY_SCORE
+                    and dependency_analysis.risk_level == "low"):
+                technical_concerns = list(self._technical_concerns(technical_analysis, dependency_analysis))
+                if not self._has_major_concerns(technical_concerns):
+                    return self._cache_review(cache_key, self._fast_approve(
+                        quality_assessment, technical_analysis, dependency_analysis, technical_concerns
+                    ))
             
-            # Step 4: Integration and dependency analysis
-            dependency_analysis = self._analyze_dependencies(ticket_draft, pm_analysis)
+            # Step 4: Acceptance criteria validation
+            ac_validation = self._validate_acceptance_criteria(description, description_lower)
             
             # Step 5: Generate comprehensive feedback
             feedback = self._generate_technical_feedback(
@@ -72,20 +262,22 @@ class TechLeadAgent:
             # Step 6: Make approval decision
             approval_decision = self._make_approval_decision(quality_assessment, feedback)
             
-            return {
+            review = {
                 "success": True,
                 "approval_status": approval_decision["status"],
                 "quality_score": quality_assessment["overall_score"],
                 "quality_assessment": quality_assessment,
-                "technical_analysis": technical_analysis,
-                "acceptance_criteria_validation": ac_validation,
-                "dependency_analysis": dependency_analysis,
-                "feedback": feedback,
+                "technical_analysis": technical_analysis.to_dict(),
+                "acceptance_criteria_validation": ac_validation.to_dict(),
+                "dependency_analysis": dependency_analysis.to_dict(),
+                "feedback": feedback.to_dict(),
                 "recommendations": approval_decision["recommendations"],
                 "agent": "Tech Lead Agent",
                 "next_step": approval_decision["next_step"]
             }
             
+            return self._cache_review(cache_key, review)
+            
         except Exception as e:
             logger.error(f"Tech Lead Agent review error: {str(e)}")
             return {
@@ -94,6 +286,44 @@ class TechLeadAgent:
                 "agent": "Tech Lead Agent"
             }
     
+    def _cache_review(self, cache_key: str, review: Dict[str, Any]) -> Dict[str, Any]:
+        """Keep a review for identical drafts and return a copy the caller may modify"""
+        
+        with self._review_cache_lock:
+            self._review_cache[cache_key] = review
+            if len(self._review_cache) > self.REVIEW_CACHE_SIZE:
+                self._review_cache.popitem(last=False)
+        
+        return copy.deepcopy(review)
+    
+    def _fast_approve(self, quality_assessment: Dict[str, Any], technical_analysis: TechnicalAnalysis,
+                      dependency_analysis: DependencyAnalysis, technical_concerns: List[str]) -> Dict[str, Any]:
+        """Approve a high-quality, low-risk draft without acceptance criteria validation"""
+        
+        logger.info(f"Tech Lead fast-approving ticket draft (quality {quality_assessment['overall_score']})")
+        
+        # Acceptance criteria are not validated on this path
+        ac_validation = ACValidation(criteria_quality="skipped")
+        feedback = Feedback(
+            overall_feedback="Ticket meets quality standards",
+            technical_concerns=technical_concerns,
+            quality_improvements=list(self._quality_improvements(quality_assessment, ac_validation))
+        )
+        
+        return {
+            "success": True,
+            "approval_status": "approved",
+            "quality_score": quality_assessment["overall_score"],
+            "quality_assessment": quality_assessment,
+            "technical_analysis": technical_analysis.to_dict(),
+            "acceptance_criteria_validation": ac_validation.to_dict(),
+            "dependency_analysis": dependency_analysis.to_dict(),
+            "feedback": feedback.to_dict(),
+            "recommendations": ["Ticket approved for creation"],
+            "agent": "Tech Lead Agent",
+            "next_step": "create_ticket"
+        }
+    
     def validate_refined_ticket(self, refined_draft: Dict[str, Any], original_feedback: Dict[str, Any]) -> Dict[str, Any]:
         """
         Validate refined ticket after PM Agent improvements
@@ -135,110 +365,78 @@ class TechLeadAgent:
                 "agent": "Tech Lead Agent"
             }
     
-    def _analyze_technical_feasibility(self, ticket_draft: Dict[str, Any], pm_analysis: Dict[str, Any]) -> Dict[str, Any]:
+    def _analyze_technical_feasibility(self, full_text: str, description_lower: str, pm_analysis: Dict[str, Any]) -> TechnicalAnalysis:
         """Analyze technical feasibility of the ticket"""
         
-        analysis = {
-            "feasibility_score": 0.7,  # Default reasonable score
-            "complexity_assessment": "medium",
-            "estimated_effort": "TBD",
-            "technical_risks": [],
-            "architecture_considerations": [],
-            "implementation_approach": ""
-        }
-        
-        summary = ticket_draft.get("summary", "").lower()
-        description = ticket_draft.get("description", "").lower()
+        # Analyze complexity indicators; the first matching level wins, highest first
+        complexity = next(
+            (level for level, (_, _, pattern) in _COMPLEXITY_TABLE.items() if pattern.search(full_text)),
+            _DEFAULT_COMPLEXITY
+        )
         
-        # Analyze complexity indicators
-        complexity_indicators = {
-            "high": ["integration", "migration", "refactor", "architecture", "performance", "security"],
-            "medium": ["feature", "enhancement", "update", "modify", "extend"],
-            "low": ["fix", "bug", "typo", "text", "styling", "minor"]
-        }
+        # Feasibility score and effort estimate follow from the complexity
+        feasibility_score, estimated_effort, _ = _COMPLEXITY_TABLE[complexity]
         
-        for complexity, indicators in complexity_indicators.items():
-            if any(indicator in summary + description for indicator in indicators):
-                analysis["complexity_assessment"] = complexity
-                break
+        analysis = TechnicalAnalysis(
+            feasibility_score=feasibility_score,
+            complexity_assessment=complexity,
+            estimated_effort=estimated_effort
+        )
         
         # Assess technical risks
-        risk_keywords = ["database", "api", "external", "third-party", "payment", "authentication"]
-        for keyword in risk_keywords:
-            if keyword in summary + description:
-                analysis["technical_risks"].append(f"Involves {keyword} - requires careful testing")
+        for keyword in _RISK_KEYWORDS:
+            if keyword in full_text:
+                analysis.technical_risks.append(f"Involves {keyword} - requires careful testing")
         
         # Consider GitBook context for architecture alignment
         if pm_analysis.get("gitbook_context", {}).get("relevant_content"):
-            analysis["architecture_considerations"].append("Reviewed against existing documentation")
-        
-        # Adjust feasibility score based on complexity
-        complexity_scores = {"low": 0.9, "medium": 0.7, "high": 0.5}
-        analysis["feasibility_score"] = complexity_scores.get(analysis["complexity_assessment"], 0.7)
+            analysis.architecture_considerations.append("Reviewed against existing documentation")
         
-        # Effort estimation
-        effort_mapping = {"low": "1-2 days", "medium": "3-5 days", "high": "1-2 weeks"}
-        analysis["estimated_effort"] = effort_mapping.get(analysis["complexity_assessment"], "TBD")
-        
-        analysis["implementation_approach"] = self._suggest_implementation_approach(ticket_draft)
+        analysis.implementation_approach = self._suggest_implementation_approach(description_lower)
         
         return analysis
     
-    def _validate_acceptance_criteria(self, ticket_draft: Dict[str, Any]) -> Dict[str, Any]:
+    def _validate_acceptance_criteria(self, description: str, description_lower: str) -> ACValidation:
         """Validate quality and completeness of acceptance criteria"""
         
-        description = ticket_draft.get("description", "")
-        validation = {
-            "criteria_count": 0,
-            "criteria_quality": "poor",
-            "testable_criteria": 0,
-            "specific_criteria": 0,
-            "missing_elements": [],
-            "recommendations": []
-        }
+        validation = ACValidation()
         
         # Count criteria (look for bullets, numbers, "given/when/then")
-        criteria_patterns = [
+        validation.criteria_count = max(
             description.count("•"),
             description.count("-"),
             description.count("*"),
-            len([line for line in description.split("\n") if line.strip() and line.strip()[0].isdigit()]),
-            description.lower().count("given"),
-            description.lower().count("when"),
-            description.lower().count("then")
-        ]
-        
-        validation["criteria_count"] = max(criteria_patterns)
-        
-        # Assess testability
-        testable_keywords = ["should", "must", "will", "verify", "confirm", "validate", "check"]
-        validation["testable_criteria"] = sum(1 for keyword in testable_keywords if keyword in description.lower())
+            sum(1 for line in description.splitlines() if line.lstrip()[:1].isdigit()),
+            description_lower.count("given"),
+            description_lower.count("when"),
+            description_lower.count("then")
+        )
         
-        # Assess specificity
-        specific_keywords = ["exactly", "within", "at least", "no more than", "specific", "particular"]
-        validation["specific_criteria"] = sum(1 for keyword in specific_keywords if keyword in description.lower())
+        # Assess testability and specificity: the number of distinct keywords present, one scan each
+        validation.testable_criteria = len(set(_TESTABLE_RE.findall(description_lower)))
+        validation.specific_criteria = len(set(_SPECIFIC_RE.findall(description_lower)))
         
         # Quality assessment
-        if validation["criteria_count"] >= 3 and validation["testable_criteria"] >= 2:
-            validation["criteria_quality"] = "good"
-        elif validation["criteria_count"] >= 2:
-            validation["criteria_quality"] = "fair"
+        if validation.criteria_count >= 3 and validation.testable_criteria >= 2:
+            validation.criteria_quality = "good"
+        elif validation.criteria_count >= 2:
+            validation.criteria_quality = "fair"
         else:
-            validation["criteria_quality"] = "poor"
+            validation.criteria_quality = "poor"
         
         # Identify missing elements
-        if validation["criteria_count"] < 3:
-            validation["missing_elements"].append("Insufficient acceptance criteria (minimum 3 required)")
+        if validation.criteria_count < 3:
+            validation.missing_elements.append("Insufficient acceptance criteria (minimum 3 required)")
         
-        if validation["testable_criteria"] < 2:
-            validation["missing_elements"].append("Criteria lack testable conditions")
+        if validation.testable_criteria < 2:
+            validation.missing_elements.append("Criteria lack testable conditions")
         
-        if "user interface" in description.lower() and "ui" not in description.lower():
-            validation["missing_elements"].append("UI/UX criteria may be needed")
+        if "user interface" in description_lower and "ui" not in description_lower:
+            validation.missing_elements.append("UI/UX criteria may be needed")
         
         # Generate recommendations
-        if validation["criteria_quality"] != "good":
-            validation["recommendations"].extend([
+        if validation.criteria_quality != "good":
+            validation.recommendations.extend([
                 "Add more specific, testable acceptance criteria",
                 "Use Given/When/Then format for complex scenarios",
                 "Include edge cases and error handling",
@@ -247,139 +445,137 @@ class TechLeadAgent:
         
         return validation
     
-    def _analyze_dependencies(self, ticket_draft: Dict[str, Any], pm_analysis: Dict[str, Any]) -> Dict[str, Any]:
+    def _analyze_dependencies(self, full_text: str, pm_analysis: Dict[str, Any]) -> DependencyAnalysis:
         """Analyze dependencies and integration points"""
         
-        dependencies = {
-            "internal_dependencies": [],
-            "external_dependencies": [],
-            "api_integrations": [],
-            "database_changes": False,
-            "ui_changes": False,
-            "breaking_changes": False,
-            "risk_level": "low"
-        }
-        
-        summary = ticket_draft.get("summary", "").lower()
-        description = ticket_draft.get("description", "").lower()
-        full_text = summary + " " + description
+        dependencies = DependencyAnalysis()
         
         # Check for internal dependencies
-        internal_keywords = ["authentication", "user management", "permissions", "config"]
-        for keyword in internal_keywords:
+        for keyword in _INTERNAL_KEYWORDS:
             if keyword in full_text:
-                dependencies["internal_dependencies"].append(keyword)
+                dependencies.internal_dependencies.append(keyword)
         
         # Check for external dependencies
-        external_keywords = ["api", "third-party", "external", "service", "integration"]
-        for keyword in external_keywords:
+        for keyword in _EXTERNAL_KEYWORDS:
             if keyword in full_text:
-                dependencies["external_dependencies"].append(keyword)
+                dependencies.external_dependencies.append(keyword)
         
         # Check for specific integrations (based on our Cloud Functions)
         if "gitbook" in full_text or "documentation" in full_text:
-            dependencies["api_integrations"].append("GitBook API")
+            dependencies.api_integrations.append("GitBook API")
         
         if "jira" in full_text or "ticket" in full_text:
-            dependencies["api_integrations"].append("Jira API")
+            dependencies.api_integrations.append("Jira API")
         
         # Check for database changes
-        db_keywords = ["database", "schema", "table", "migration", "data"]
-        dependencies["database_changes"] = any(keyword in full_text for keyword in db_keywords)
+        dependencies.database_changes = bool(_DB_RE.search(full_text))
         
         # Check for UI changes
-        ui_keywords = ["interface", "ui", "frontend", "display", "view", "screen"]
-        dependencies["ui_changes"] = any(keyword in full_text for keyword in ui_keywords)
+        dependencies.ui_changes = bool(_UI_RE.search(full_text))
         
         # Check for breaking changes
-        breaking_keywords = ["remove", "delete", "deprecate", "replace", "breaking"]
-        dependencies["breaking_changes"] = any(keyword in full_text for keyword in breaking_keywords)
+        dependencies.breaking_changes = bool(_BREAKING_RE.search(full_text))
         
         # Assess risk level
         risk_factors = (
-            len(dependencies["external_dependencies"]) +
-            len(dependencies["api_integrations"]) +
-            (1 if dependencies["database_changes"] else 0) +
-            (1 if dependencies["breaking_changes"] else 0)
+            len(dependencies.external_dependencies) +
+            len(dependencies.api_integrations) +
+            (1 if dependencies.database_changes else 0) +
+            (1 if dependencies.breaking_changes else 0)
         )
         
         if risk_factors >= 3:
-            dependencies["risk_level"] = "high"
+            dependencies.risk_level = "high"
         elif risk_factors >= 2:
-            dependencies["risk_level"] = "medium"
+            dependencies.risk_level = "medium"
         else:
-            dependencies["risk_level"] = "low"
+            dependencies.risk_level = "low"
         
         return dependencies
     
     def _generate_technical_feedback(self, ticket_draft: Dict[str, Any], quality_assessment: Dict[str, Any], 
-                                   technical_analysis: Dict[str, Any], ac_validation: Dict[str, Any], 
-                                   dependency_analysis: Dict[str, Any]) -> Dict[str, Any]:
+                                   technical_analysis: TechnicalAnalysis, ac_validation: ACValidation, 
+                                   dependency_analysis: DependencyAnalysis) -> Feedback:
         """Generate comprehensive technical feedback"""
         
-        feedback = {
-            "overall_feedback": "",
-            "technical_concerns": [],
-            "quality_improvements": [],
-            "implementation_suggestions": [],
-            "risk_mitigation": [],
-            "priority_adjustments": []
-        }
-        
         # Overall feedback based on quality score
         if quality_assessment["overall_score"] >= 0.8:
-            feedback["overall_feedback"] = "Ticket meets quality standards with minor recommendations"
+            overall_feedback = "Ticket meets quality standards with minor recommendations"
         elif quality_assessment["overall_score"] >= 0.6:
-            feedback["overall_feedback"] = "Ticket needs improvement before approval"
+            overall_feedback = "Ticket needs improvement before approval"
         else:
-            feedback["overall_feedback"] = "Ticket requires significant revision"
+            overall_feedback = "Ticket requires significant revision"
+        
+        return Feedback(
+            overall_feedback=overall_feedback,
+            technical_concerns=list(self._technical_concerns(technical_analysis, dependency_analysis)),
+            quality_improvements=list(self._quality_improvements(quality_assessment, ac_validation)),
+            implementation_suggestions=list(self._implementation_suggestions(technical_analysis, dependency_analysis)),
+            risk_mitigation=list(self._risk_mitigation(dependency_analysis)),
+            priority_adjustments=list(self._priority_adjustments(ticket_draft, technical_analysis))
+        )
+    
+    def _technical_concerns(self, technical_analysis: TechnicalAnalysis,
+                            dependency_analysis: DependencyAnalysis) -> Iterator[str]:
+        """Yield technical concerns"""
         
-        # Technical concerns
-        if technical_analysis["complexity_assessment"] == "high":
-            feedback["technical_concerns"].append("High complexity - consider breaking into smaller tickets")
+        if technical_analysis.complexity_assessment == "high":
+            yield "High complexity - consider breaking into smaller tickets"
         
-        if technical_analysis["technical_risks"]:
-            feedback["technical_concerns"].extend(technical_analysis["technical_risks"])
+        yield from technical_analysis.technical_risks
         
-        if dependency_analysis["risk_level"] == "high":
-            feedback["technical_concerns"].append("High dependency risk - ensure integration testing")
+        if dependency_analysis.risk_level == "high":
+            yield "High dependency risk - ensure integration testing"
+    
+    def _quality_improvements(self, quality_assessment: Dict[str, Any], ac_validation: ACValidation) -> Iterator[str]:
+        """Yield quality improvements"""
         
-        # Quality improvements
-        if ac_validation["criteria_quality"] != "good":
-            feedback["quality_improvements"].extend(ac_validation["recommendations"])
+        if ac_validation.criteria_quality != "good":
+            yield from ac_validation.recommendations
         
         for area, score in quality_assessment["detailed_scores"].items():
             if score < 0.7:
-                feedback["quality_improvements"].append(f"Improve {area.replace('_', ' ')}")
+                yield _AREA_LABELS[area] if area in _AREA_LABELS else f"Improve {area.replace('_', ' ')}"
+    
+    def _implementation_suggestions(self, technical_analysis: TechnicalAnalysis,
+                                    dependency_analysis: DependencyAnalysis) -> Iterator[str]:
+        """Yield implementation suggestions"""
         
-        # Implementation suggestions
-        if technical_analysis["implementation_approach"]:
-            feedback["implementation_suggestions"].append(technical_analysis["implementation_approach"])
+        if technical_analysis.implementation_approach:
+            yield technical_analysis.implementation_approach
         
-        if dependency_analysis["database_changes"]:
-            feedback["implementation_suggestions"].append("Include database migration strategy")
+        if dependency_analysis.database_changes:
+            yield "Include database migration strategy"
         
-        if dependency_analysis["ui_changes"]:
-            feedback["implementation_suggestions"].append("Include UI/UX design considerations")
+        if dependency_analysis.ui_changes:
+            yield "Include UI/UX design considerations"
+    
+    def _risk_mitigation(self, dependency_analysis: DependencyAnalysis) -> Iterator[str]:
+        """Yield risk mitigation steps"""
         
-        # Risk mitigation
-        if dependency_analysis["breaking_changes"]:
-            feedback["risk_mitigation"].append("Implement backward compatibility or migration plan")
+        if dependency_analysis.breaking_changes:
+            yield "Implement backward compatibility or migration plan"
         
-        if dependency_analysis["external_dependencies"]:
-            feedback["risk_mitigation"].append("Add fallback mechanisms for external dependencies")
+        if dependency_analysis.external_dependencies:
+            yield "Add fallback mechanisms for external dependencies"
+    
+    def _priority_adjustments(self, ticket_draft: Dict[str, Any], technical_analysis: TechnicalAnalysis) -> Iterator[str]:
+        """Yield priority adjustments"""
         
-        # Priority adjustments
-        if technical_analysis["complexity_assessment"] == "high" and ticket_draft.get("priority") == "High":
-            feedback["priority_adjustments"].append("Consider reducing priority due to high complexity")
+        if technical_analysis.complexity_assessment == "high" and ticket_draft.get("priority") == "High":
+            yield "Consider reducing priority due to high complexity"
+    
+    @staticmethod
+    def _has_major_concerns(technical_concerns: List[str]) -> bool:
+        """More than two technical concerns block approval"""
         
-        return feedback
+        return len(technical_concerns) > 2
     
-    def _make_approval_decision(self, quality_assessment: Dict[str, Any], feedback: Dict[str, Any]) -> Dict[str, Any]:
+    def _make_approval_decision(self, quality_assessment: Dict[str, Any], feedback: Feedback) -> Dict[str, Any]:
         """Make approval decision based on assessment"""
         
         quality_score = quality_assessment["overall_score"]
-        has_major_concerns = len(feedback["technical_concerns"]) > 2
+        has_major_concerns = self._has_major_concerns(feedback.technical_concerns)
         
         if quality_score >= 0.8 and not has_major_concerns:
             return {
@@ -391,13 +587,13 @@ class TechLeadAgent:
             return {
                 "status": "needs_improvement",
                 "next_step": "refine_ticket",
-                "recommendations": feedback["quality_improvements"] + feedback["technical_concerns"]
+                "recommendations": feedback.quality_improvements + feedback.technical_concerns
             }
         else:
             return {
                 "status": "rejected",
                 "next_step": "major_revision",
-                "recommendations": ["Significant revision required"] + feedback["quality_improvements"]
+                "recommendations": ["Significant revision required"] + feedback.quality_improvements
             }
     
     def _make_final_approval_decision(self, quality_assessment: Dict[str, Any], feedback_addressed: Dict[str, Any]) -> Dict[str, Any]:
@@ -432,47 +628,19 @@ class TechLeadAgent:
             "remaining_issues": []
         }
     
-    def _suggest_implementation_approach(self, ticket_draft: Dict[str, Any]) -> str:
-        """Suggest implementation approach based on ticket content"""
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _suggest_implementation_approach(description_lower: str) -> str:
+        """Suggest implementation approach based on ticket content (memoized across refinement loops)"""
         
-        description = ticket_draft.get("description", "").lower()
-        
-        if "api" in description:
+        if "api" in description_lower:
             return "Consider API-first approach with proper error handling and testing"
-        elif "ui" in description or "interface" in description:
+        elif "ui" in description_lower or "interface" in description_lower:
             return "Start with wireframes and user testing before implementation"
-        elif "database" in description:
+        elif "database" in description_lower:
             return "Design schema changes carefully with migration strategy"
         else:
             return "Follow standard development workflow with testing at each stage"
-    
-    def _get_agent_instructions(self) -> str:
-        """Get agent instructions and personality"""
-        return """
-You are a Senior Tech Lead AI Agent specialized in technical review and quality assurance.
-
-Your responsibilities:
-1. Review PM Agent ticket drafts for technical feasibility
-2. Validate acceptance criteria completeness and quality
-3. Analyze dependencies and integration points
-4. Assess technical risks and complexity
-5. Provide constructive feedback for improvement
-6. Ensure tickets meet technical and quality standards
-
-Your personality:
-- Technically rigorous and detail-oriented
-- Constructive and helpful in feedback
-- Risk-aware but solution-focused
-- Quality-driven with high standards
-- Collaborative with PM Agent
-
-Quality Standards:
-- Technical feasibility must be realistic
-- Acceptance criteria must be testable and complete
-- Dependencies must be identified and addressed
-- Implementation approach must be sound
-- Overall quality score must be ≥ 0.8 for approval
-"""
 
 
 # Export the Tech Lead Agent class
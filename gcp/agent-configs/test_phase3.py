@@ -5,9 +5,17 @@ Phase 3 Testing Suite - Comprehensive testing for advanced features
 Tests business rules engine, monitoring system, and production deployment
 """
 
+import os
+import sys
 import time
+import itertools
+import threading
 import logging
-from typing import Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import cached_property
+from types import MappingProxyType
+from typing import Dict, Any, FrozenSet, Mapping, Optional, Tuple
 from datetime import datetime
 
 from business_rules import BusinessRulesEngine, Priority, IssueType, BusinessRuleCategory
@@ -18,45 +26,137 @@ from orchestrator import MultiAgentOrchestrator
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+@dataclass(frozen=True, slots=True)
+class BusinessRuleCase:
+    """Ticket draft and the business rules outcome expected for it"""
+    name: str
+    ticket_draft: Mapping[str, Any]  # Read-only, shared by every run
+    expected_rules: FrozenSet[str]
+    expected_priority: Optional[str] = None
+    expected_labels: Optional[FrozenSet[str]] = None
+
+# Test detail buffered during a run: (test, status, error or None, extra fields or None)
+DetailRecord = Tuple[str, str, Optional[str], Optional[Dict[str, Any]]]
+
+def _detail_dict(detail: DetailRecord) -> Dict[str, Any]:
+    """Expand a buffered test detail into its report dict"""
+    test, status, error, extra = detail
+    record = {"test": test, "status": status}
+    if error is not None:
+        record["error"] = error
+    if extra:
+        record.update(extra)
+    return record
+
+# Business rules test cases, built once at import
+_BR_TEST_CASES: Tuple[BusinessRuleCase, ...] = (
+    BusinessRuleCase(
+        name="Security Rule Application",
+        ticket_draft=MappingProxyType({
+            "summary": "Add user authentication system",
+            "description": "Implement secure login with OAuth integration",
+            "priority": "Medium"
+        }),
+        expected_rules=frozenset(("security_rules",)),
+        expected_priority="High"
+    ),
+    BusinessRuleCase(
+        name="Performance Rule Application",
+        ticket_draft=MappingProxyType({
+            "summary": "Optimize database query performance",
+            "description": "Improve query execution time and reduce latency",
+            "priority": "Medium"
+        }),
+        expected_rules=frozenset(("performance_rules",)),
+        expected_labels=frozenset(("performance", "optimization"))
+    ),
+    BusinessRuleCase(
+        name="Integration Rule Application",
+        ticket_draft=MappingProxyType({
+            "summary": "Add external API integration",
+            "description": "Integrate with third-party payment service API",
+            "priority": "Medium"
+        }),
+        expected_rules=frozenset(("integration_rules",)),
+        expected_labels=frozenset(("integration", "external-dependency"))
+    ),
+    BusinessRuleCase(
+        name="UI/UX Rule Application",
+        ticket_draft=MappingProxyType({
+            "summary": "Redesign user interface",
+            "description": "Update frontend design for better user experience",
+            "priority": "Low"
+        }),
+        expected_rules=frozenset(("ui_ux_rules",)),
+        expected_labels=frozenset(("ui", "ux", "frontend"))
+    )
+)
+
 class Phase3TestSuite:
     """Comprehensive test suite for Phase 3 features"""
     
+    _workflow_ids = itertools.count(1)  # Unique test workflow ids, even for tests started in the same second
+    
     def __init__(self):
-        self.business_rules = BusinessRulesEngine()
-        self.monitoring = MonitoringSystem()
-        self.orchestrator = MultiAgentOrchestrator()
-        
         self.test_results = {
             "business_rules": {},
             "monitoring": {},
             "production_readiness": {},
             "integration": {}
         }
+        
+        # Running (passed, failed) totals across all phases, updated as each test finishes
+        self._totals = [0, 0]
+        self._totals_lock = threading.Lock()
+    
+    # Subsystems are created on first use, so a run that skips them does not pay for their setup
+    @cached_property
+    def business_rules(self) -> BusinessRulesEngine:
+        return BusinessRulesEngine()
+    
+    @cached_property
+    def monitoring(self) -> MonitoringSystem:
+        return MonitoringSystem()
     
-    def run_all_tests(self) -> Dict[str, Any]:
-        """Run complete Phase 3 test suite"""
+    @cached_property
+    def orchestrator(self) -> MultiAgentOrchestrator:
+        return MultiAgentOrchestrator()
+    
+    def run_all_tests(self, fail_fast: bool = False) -> Dict[str, Any]:
+        """Run complete Phase 3 test suite, skipping integration after failures when fail_fast is set"""
         
         logger.info("🚀 Starting Phase 3 Comprehensive Test Suite")
         logger.info("=" * 60)
         
         start_time = time.time()
+        self._totals = [0, 0]
         
         try:
-            # Test 1: Business Rules Engine
+            # Tests 1, 2 and 4 exercise disjoint subsystems, so they run concurrently
             logger.info("📋 Testing Business Rules Engine...")
-            self.test_results["business_rules"] = self._test_business_rules_engine()
-            
-            # Test 2: Monitoring System
             logger.info("📊 Testing Monitoring System...")
-            self.test_results["monitoring"] = self._test_monitoring_system()
-            
-            # Test 3: Integration Testing
-            logger.info("🔗 Testing System Integration...")
-            self.test_results["integration"] = self._test_system_integration()
-            
-            # Test 4: Production Readiness
             logger.info("🏭 Testing Production Readiness...")
-            self.test_results["production_readiness"] = self._test_production_readiness()
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                futures = {
+                    "business_rules": executor.submit(self._test_business_rules_engine),
+                    "monitoring": executor.submit(self._test_monitoring_system),
+                    "production_readiness": executor.submit(self._test_production_readiness)
+                }
+            for phase, future in futures.items():
+                self.test_results[phase] = future.result()
+            
+            # Test 3: Integration Testing, once the monitoring system has been verified
+            if fail_fast and any(self.test_results[phase]["tests_failed"] > 0 for phase in futures):
+                logger.warning("⏭️ Skipping System Integration after earlier failures (fail-fast)")
+                self.test_results["integration"] = {
+                    "tests_passed": 0,
+                    "tests_failed": 0,
+                    "test_details": [],
+                    "skipped": True
+                }
+            else:
+                logger.info("🔗 Testing System Integration...")
+                self.test_results["integration"] = self._test_system_integration()
             
             execution_time = time.time() - start_time
             
@@ -67,13 +167,25 @@ class Phase3TestSuite:
             return final_report
             
         except Exception as e:
-            logger.error(f"❌ Phase 3 Testing Failed: {str(e)}")
+            logger.error("❌ Phase 3 Testing Failed: %s", e)
             return {
                 "success": False,
                 "error": str(e),
-                "test_results": self.test_results
+                "test_results": self._materialized_results()
             }
     
+    def _record_pass(self, results: Dict[str, Any]) -> None:
+        """Count a passed test in its phase results and the running totals"""
+        results["tests_passed"] += 1
+        with self._totals_lock:
+            self._totals[0] += 1
+    
+    def _record_fail(self, results: Dict[str, Any]) -> None:
+        """Count a failed test in its phase results and the running totals"""
+        results["tests_failed"] += 1
+        with self._totals_lock:
+            self._totals[1] += 1
+    
     def _test_business_rules_engine(self) -> Dict[str, Any]:
         """Test business rules engine functionality"""
         
@@ -83,112 +195,58 @@ class Phase3TestSuite:
             "test_details": []
         }
         
-        test_cases = [
-            {
-                "name": "Security Rule Application",
-                "ticket_draft": {
-                    "summary": "Add user authentication system",
-                    "description": "Implement secure login with OAuth integration",
-                    "priority": "Medium"
-                },
-                "expected_rules": ["security_rules"],
-                "expected_priority": "High"
-            },
-            {
-                "name": "Performance Rule Application", 
-                "ticket_draft": {
-                    "summary": "Optimize database query performance",
-                    "description": "Improve query execution time and reduce latency",
-                    "priority": "Medium"
-                },
-                "expected_rules": ["performance_rules"],
-                "expected_labels": ["performance", "optimization"]
-            },
-            {
-                "name": "Integration Rule Application",
-                "ticket_draft": {
-                    "summary": "Add external API integration",
-                    "description": "Integrate with third-party payment service API",
-                    "priority": "Medium"
-                },
-                "expected_rules": ["integration_rules"],
-                "expected_labels": ["integration", "external-dependency"]
-            },
-            {
-                "name": "UI/UX Rule Application",
-                "ticket_draft": {
-                    "summary": "Redesign user interface",
-                    "description": "Update frontend design for better user experience",
-                    "priority": "Low"
-                },
-                "expected_rules": ["ui_ux_rules"],
-                "expected_labels": ["ui", "ux", "frontend"]
-            }
-        ]
-        
-        for test_case in test_cases:
+        for test_case in _BR_TEST_CASES:
             try:
-                logger.info(f"  Testing: {test_case['name']}")
+                logger.info("  Testing: %s", test_case.name)
                 
                 # Apply business rules
                 result = self.business_rules.apply_business_rules(
-                    test_case["ticket_draft"], 
+                    test_case.ticket_draft, 
                     {}
                 )
                 
                 if not result["success"]:
-                    results["tests_failed"] += 1
-                    results["test_details"].append({
-                        "test": test_case["name"],
-                        "status": "failed",
-                        "error": "Business rules application failed"
-                    })
+                    self._record_fail(results)
+                    results["test_details"].append((test_case.name, "failed", "Business rules application failed", None))
                     continue
                 
+                enhanced_ticket = result["enhanced_ticket"]
+                
                 # Verify expected rules were applied
                 rules_applied = result["rule_results"]["rules_applied"]
-                expected_rules = test_case.get("expected_rules", [])
+                expected_rules = test_case.expected_rules
                 
-                rules_match = all(rule in rules_applied for rule in expected_rules)
+                rules_match = expected_rules.issubset(rules_applied)
                 
                 # Verify priority changes if expected
                 priority_correct = True
-                if "expected_priority" in test_case:
-                    priority_correct = result["enhanced_ticket"]["priority"] == test_case["expected_priority"]
+                if test_case.expected_priority is not None:
+                    priority_correct = enhanced_ticket["priority"] == test_case.expected_priority
                 
                 # Verify labels if expected
                 labels_correct = True
-                if "expected_labels" in test_case:
-                    ticket_labels = result["enhanced_ticket"].get("labels", [])
-                    labels_correct = all(label in ticket_labels for label in test_case["expected_labels"])
+                if test_case.expected_labels is not None:
+                    ticket_labels = enhanced_ticket.get("labels", ())
+                    labels_correct = test_case.expected_labels.issubset(ticket_labels)
                 
                 if rules_match and priority_correct and labels_correct:
-                    results["tests_passed"] += 1
-                    results["test_details"].append({
-                        "test": test_case["name"],
-                        "status": "passed",
+                    self._record_pass(results)
+                    results["test_details"].append((test_case.name, "passed", None, {
                         "rules_applied": rules_applied
-                    })
-                    logger.info(f"    ✅ {test_case['name']} passed")
+                    }))
+                    logger.info("    ✅ %s passed", test_case.name)
                 else:
-                    results["tests_failed"] += 1
-                    results["test_details"].append({
-                        "test": test_case["name"],
-                        "status": "failed",
-                        "error": "Expected behavior not met",
+                    self._record_fail(results)
+                    results["test_details"].append((test_case.name, "failed", "Expected behavior not met", {
                         "rules_applied": rules_applied,
-                        "expected_rules": expected_rules
-                    })
-                    logger.warning(f"    ❌ {test_case['name']} failed")
+                        "expected_rules": sorted(expected_rules)
+                    }))
+                    logger.warning("    ❌ %s failed", test_case.name)
                 
             except Exception as e:
-                results["tests_failed"] += 1
-                results["test_details"].append({
-                    "test": test_case["name"],
-                    "status": "failed",
-                    "error": str(e)
-                })
-                logger.error(f"    ❌ {test_case['name']} failed: {str(e)}")
+                self._record_fail(results)
+                results["test_details"].append((test_case.name, "failed", str(e), None))
+                logger.error("    ❌ %s failed: %s", test_case.name, e)
         
         # Test compliance validation
         try:
@@ -202,29 +260,19 @@ class Phase3TestSuite:
             compliance_result = self.business_rules.validate_compliance(gdpr_ticket)
             
             if not compliance_result["compliant"]:
-                results["tests_passed"] += 1
-                results["test_details"].append({
-                    "test": "GDPR Compliance Validation",
-                    "status": "passed",
+                self._record_pass(results)
+                results["test_details"].append(("GDPR Compliance Validation", "passed", None, {
                     "violations_detected": len(compliance_result["violations"])
-                })
+                }))
                 logger.info("    ✅ GDPR Compliance Validation passed")
             else:
-                results["tests_failed"] += 1
-                results["test_details"].append({
-                    "test": "GDPR Compliance Validation",
-                    "status": "failed",
-                    "error": "Expected GDPR violations not detected"
-                })
+                self._record_fail(results)
+                results["test_details"].append(("GDPR Compliance Validation", "failed", "Expected GDPR violations not detected", None))
                 logger.warning("    ❌ GDPR Compliance Validation failed")
                 
         except Exception as e:
-            results["tests_failed"] += 1
-            results["test_details"].append({
-                "test": "GDPR Compliance Validation",
-                "status": "failed",
-                "error": str(e)
-            })
+            self._record_fail(results)
+            results["test_details"].append(("GDPR Compliance Validation", "failed", str(e), None))
         
         return results
     
@@ -241,7 +289,7 @@ class Phase3TestSuite:
             # Test workflow monitoring lifecycle
             logger.info("  Testing: Workflow Monitoring Lifecycle")
             
-            workflow_id = f"test_workflow_{int(time.time())}"
+            workflow_id = f"test_workflow_{next(self._workflow_ids)}"
             
             # Start monitoring
             start_result = self.monitoring.start_workflow_monitoring(
@@ -253,17 +301,11 @@ class Phase3TestSuite:
                 logger.info("    ✅ Workflow monitoring started successfully")
                 
                 # Track agent execution
-                self.monitoring.track_agent_execution(
-                    workflow_id, "PM Agent", 2.5, True, 0.85, 1
-                )
-                
-                self.monitoring.track_agent_execution(
-                    workflow_id, "Tech Lead Agent", 1.8, True, 0.88, 1
-                )
-                
-                self.monitoring.track_agent_execution(
-                    workflow_id, "Jira Creator Agent", 1.2, True, None, 1
-                )
+                self.monitoring.track_agent_executions(workflow_id, [
+                    ("PM Agent", 2.5, True, 0.85, 1),
+                    ("Tech Lead Agent", 1.8, True, 0.88, 1),
+                    ("Jira Creator Agent", 1.2, True, None, 1)
+                ])
                 
                 # Track business rules
                 self.monitoring.track_business_rules(
@@ -276,35 +318,21 @@ class Phase3TestSuite:
                 )
                 
                 if completion_result["monitoring_completed"]:
-                    results["tests_passed"] += 1
-                    results["test_details"].append({
-                        "test": "Workflow Monitoring Lifecycle",
-                        "status": "passed",
+                    self._record_pass(results)
+                    results["test_details"].append(("Workflow Monitoring Lifecycle", "passed", None, {
                         "execution_time": completion_result["total_execution_time"]
-                    })
+                    }))
                     logger.info("    ✅ Workflow monitoring lifecycle completed")
                 else:
-                    results["tests_failed"] += 1
-                    results["test_details"].append({
-                        "test": "Workflow Monitoring Lifecycle",
-                        "status": "failed",
-                        "error": "Monitoring completion failed"
-                    })
+                    self._record_fail(results)
+                    results["test_details"].append(("Workflow Monitoring Lifecycle", "failed", "Monitoring completion failed", None))
             else:
-                results["tests_failed"] += 1
-                results["test_details"].append({
-                    "test": "Workflow Monitoring Lifecycle",
-                    "status": "failed",
-                    "error": "Failed to start monitoring"
-                })
+                self._record_fail(results)
+                results["test_details"].append(("Workflow Monitoring Lifecycle", "failed", "Failed to start monitoring", None))
             
         except Exception as e:
-            results["tests_failed"] += 1
-            results["test_details"].append({
-                "test": "Workflow Monitoring Lifecycle",
-                "status": "failed",
-                "error": str(e)
-            })
+            self._record_fail(results)
+            results["test_details"].append(("Workflow Monitoring Lifecycle", "failed", str(e), None))
         
         # Test analytics dashboard
         try:
@@ -313,28 +341,18 @@ class Phase3TestSuite:
             dashboard = self.monitoring.get_analytics_dashboard(1)  # 1 hour range
             
             if "summary" in dashboard and "agent_performance" in dashboard:
-                results["tests_passed"] += 1
-                results["test_details"].append({
-                    "test": "Analytics Dashboard Generation",
-                    "status": "passed",
+                self._record_pass(results)
+                results["test_details"].append(("Analytics Dashboard Generation", "passed", None, {
                     "dashboard_sections": list(dashboard.keys())
-                })
+                }))
                 logger.info("    ✅ Analytics dashboard generated successfully")
             else:
-                results["tests_failed"] += 1
-                results["test_details"].append({
-                    "test": "Analytics Dashboard Generation",
-                    "status": "failed",
-                    "error": "Dashboard missing required sections"
-                })
+                self._record_fail(results)
+                results["test_details"].append(("Analytics Dashboard Generation", "failed", "Dashboard missing required sections", None))
                 
         except Exception as e:
-            results["tests_failed"] += 1
-            results["test_details"].append({
-                "test": "Analytics Dashboard Generation",
-                "status": "failed",
-                "error": str(e)
-            })
+            self._record_fail(results)
+            results["test_details"].append(("Analytics Dashboard Generation", "failed", str(e), None))
         
         return results
     
@@ -356,7 +374,7 @@ class Phase3TestSuite:
             
             # This would normally call the orchestrator, but we'll simulate it
             # since we don't have actual Vertex AI credentials in testing
-            workflow_id = f"integration_test_{int(time.time())}"
+            workflow_id = f"integration_test_{next(self._workflow_ids)}"
             
             # Start monitoring
             self.monitoring.start_workflow_monitoring(workflow_id, test_request)
@@ -380,17 +398,11 @@ class Phase3TestSuite:
                 self.monitoring.track_business_rules(workflow_id, rules_applied, 0.8)
                 
                 # Simulate agent executions
-                self.monitoring.track_agent_execution(
-                    workflow_id, "PM Agent", 3.2, True, 0.82, 1
-                )
-                
-                self.monitoring.track_agent_execution(
-                    workflow_id, "Tech Lead Agent", 2.1, True, 0.91, 1
-                )
-                
-                self.monitoring.track_agent_execution(
-                    workflow_id, "Jira Creator Agent", 1.4, True, None, 1
-                )
+                self.monitoring.track_agent_executions(workflow_id, [
+                    ("PM Agent", 3.2, True, 0.82, 1),
+                    ("Tech Lead Agent", 2.1, True, 0.91, 1),
+                    ("Jira Creator Agent", 1.4, True, None, 1)
+                ])
                 
                 # Complete workflow
                 completion_result = self.monitoring.complete_workflow_monitoring(
@@ -402,37 +414,23 @@ class Phase3TestSuite:
                     "security_rules" in rules_applied and
                     business_rules_result["enhanced_ticket"]["priority"] == "High"):
                     
-                    results["tests_passed"] += 1
-                    results["test_details"].append({
-                        "test": "Complete System Integration",
-                        "status": "passed",
+                    self._record_pass(results)
+                    results["test_details"].append(("Complete System Integration", "passed", None, {
                         "workflow_id": workflow_id,
                         "rules_applied": rules_applied,
                         "total_execution_time": completion_result["total_execution_time"]
-                    })
+                    }))
                     logger.info("    ✅ System integration test passed")
                 else:
-                    results["tests_failed"] += 1
-                    results["test_details"].append({
-                        "test": "Complete System Integration",
-                        "status": "failed",
-                        "error": "Integration components not working together properly"
-                    })
+                    self._record_fail(results)
+                    results["test_details"].append(("Complete System Integration", "failed", "Integration components not working together properly", None))
             else:
-                results["tests_failed"] += 1
-                results["test_details"].append({
-                    "test": "Complete System Integration",
-                    "status": "failed",
-                    "error": "Business rules application failed"
-                })
+                self._record_fail(results)
+                results["test_details"].append(("Complete System Integration", "failed", "Business rules application failed", None))
                 
         except Exception as e:
-            results["tests_failed"] += 1
-            results["test_details"].append({
-                "test": "Complete System Integration",
-                "status": "failed",
-                "error": str(e)
-            })
+            self._record_fail(results)
+            results["test_details"].append(("Complete System Integration", "failed", str(e), None))
         
         return results
     
@@ -456,47 +454,41 @@ class Phase3TestSuite:
         
         for file_name in required_files:
             try:
-                with open(file_name, 'r') as f:
-                    content = f.read()
-                    if len(content) > 100:  # Basic sanity check
-                        results["tests_passed"] += 1
-                        results["test_details"].append({
-                            "test": f"File: {file_name}",
-                            "status": "passed",
-                            "size": len(content)
-                        })
-                        logger.info(f"    ✅ {file_name} exists and has content")
-                    else:
-                        results["tests_failed"] += 1
-                        results["test_details"].append({
-                            "test": f"File: {file_name}",
-                            "status": "failed",
-                            "error": "File too small or empty"
-                        })
-                        
+                # The size alone answers the sanity check, so the file is never read
+                size = os.stat(file_name).st_size
+                if size > 100:  # Basic sanity check
+                    self._record_pass(results)
+                    results["test_details"].append((f"File: {file_name}", "passed", None, {
+                        "size": size
+                    }))
+                    logger.info("    ✅ %s exists and has content", file_name)
+                else:
+                    self._record_fail(results)
+                    results["test_details"].append((f"File: {file_name}", "failed", "File too small or empty", None))
+                    
             except FileNotFoundError:
-                results["tests_failed"] += 1
-                results["test_details"].append({
-                    "test": f"File: {file_name}",
-                    "status": "failed",
-                    "error": "File not found"
-                })
-                logger.warning(f"    ❌ {file_name} not found")
+                self._record_fail(results)
+                results["test_details"].append((f"File: {file_name}", "failed", "File not found", None))
+                logger.warning("    ❌ %s not found", file_name)
             except Exception as e:
-                results["tests_failed"] += 1
-                results["test_details"].append({
-                    "test": f"File: {file_name}",
-                    "status": "failed",
-                    "error": str(e)
-                })
+                self._record_fail(results)
+                results["test_details"].append((f"File: {file_name}", "failed", str(e), None))
         
         return results
     
+    def _materialized_results(self) -> Dict[str, Any]:
+        """Test results with the buffered test details expanded into dicts"""
+        
+        return {
+            phase: {**result, "test_details": [_detail_dict(detail) for detail in result["test_details"]]}
+            if "test_details" in result else result
+            for phase, result in self.test_results.items()
+        }
+    
     def _generate_test_report(self, execution_time: float) -> Dict[str, Any]:
         """Generate comprehensive test report"""
         
-        total_tests_passed = sum(result["tests_passed"] for result in self.test_results.values())
-        total_tests_failed = sum(result["tests_failed"] for result in self.test_results.values())
+        total_tests_passed, total_tests_failed = self._totals
         total_tests = total_tests_passed + total_tests_failed
         
         success_rate = (total_tests_passed / total_tests * 100) if total_tests > 0 else 0
@@ -510,11 +502,12 @@ class Phase3TestSuite:
                 "tests_failed": total_tests_failed,
                 "success_rate_percent": round(success_rate, 2)
             },
-            "detailed_results": self.test_results,
+            "detailed_results": self._materialized_results(),
             "phase3_readiness": {
                 "business_rules_engine": self.test_results["business_rules"]["tests_failed"] == 0,
                 "monitoring_system": self.test_results["monitoring"]["tests_failed"] == 0,
-                "system_integration": self.test_results["integration"]["tests_failed"] == 0,
+                "system_integration": (self.test_results["integration"]["tests_failed"] == 0 and
+                                       not self.test_results["integration"].get("skipped")),
                 "production_readiness": self.test_results["production_readiness"]["tests_failed"] == 0
             },
             "recommendations": []
@@ -529,6 +522,8 @@ class Phase3TestSuite:
         
         if self.test_results["integration"]["tests_failed"] > 0:
             report["recommendations"].append("Resolve system integration problems")
+        elif self.test_results["integration"].get("skipped"):
+            report["recommendations"].append("Rerun without fail-fast to test system integration")
         
         if self.test_results["production_readiness"]["tests_failed"] > 0:
             report["recommendations"].append("Complete production deployment preparation")
@@ -543,35 +538,48 @@ class Phase3TestSuite:
         return report
 
 
-def main():
+# Display names for the phase3_readiness components
+_READINESS_LABELS = {
+    "business_rules_engine": "Business Rules Engine",
+    "monitoring_system": "Monitoring System",
+    "system_integration": "System Integration",
+    "production_readiness": "Production Readiness"
+}
+
+
+def main(fail_fast: bool = False):
     """Run the Phase 3 test suite"""
-    print("🚀 PM Jira Agent - Phase 3 Test Suite")
-    print("=" * 50)
+    # Each block of output is joined and written at once rather than line by line
+    sys.stdout.write("🚀 PM Jira Agent - Phase 3 Test Suite\n" + "=" * 50 + "\n")
+    sys.stdout.flush()
     
     test_suite = Phase3TestSuite()
-    results = test_suite.run_all_tests()
+    results = test_suite.run_all_tests(fail_fast=fail_fast)
     
-    print("\n📋 Test Results Summary")
-    print("-" * 30)
-    print(f"Total Tests: {results['summary']['total_tests']}")
-    print(f"Passed: {results['summary']['tests_passed']}")
-    print(f"Failed: {results['summary']['tests_failed']}")
-    print(f"Success Rate: {results['summary']['success_rate_percent']}%")
-    print(f"Execution Time: {results['execution_time']}s")
+    buf = [
+        "\n📋 Test Results Summary",
+        "-" * 30,
+        f"Total Tests: {results['summary']['total_tests']}",
+        f"Passed: {results['summary']['tests_passed']}",
+        f"Failed: {results['summary']['tests_failed']}",
+        f"Success Rate: {results['summary']['success_rate_percent']}%",
+        f"Execution Time: {results['execution_time']}s"
+    ]
     
-    print("\n🎯 Phase 3 Readiness:")
+    buf.append("\n🎯 Phase 3 Readiness:")
     readiness = results["phase3_readiness"]
     for component, ready in readiness.items():
         status = "✅" if ready else "❌"
-        print(f"  {status} {component.replace('_', ' ').title()}")
+        buf.append(f"  {status} {_READINESS_LABELS[component]}")
     
-    print("\n💡 Recommendations:")
+    buf.append("\n💡 Recommendations:")
     for rec in results["recommendations"]:
-        print(f"  • {rec}")
+        buf.append(f"  • {rec}")
+    
+    sys.stdout.write("\n".join(buf) + "\n")
     
     return results["success"]
 
-
 if __name__ == "__main__":
-    success = main()
+    success = main(fail_fast="--fail-fast" in sys.argv)
     exit(0 if success else 1)
\ No newline at end of file
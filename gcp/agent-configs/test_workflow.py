@@ -17,15 +17,20 @@ sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 from orchestrator import create_jira_ticket_with_ai, MultiAgentOrchestrator
 from tools import CloudFunctionTools, QualityGates
 
-def test_cloud_function_connectivity():
+async def test_cloud_function_connectivity():
     """Test connectivity to deployed Cloud Functions"""
     print("🔧 Testing Cloud Function Connectivity...")
     
     tools = CloudFunctionTools()
     
+    # The GitBook and Jira calls are independent, so both requests are in flight at once
+    gitbook_result, jira_result = await asyncio.gather(
+        asyncio.to_thread(tools.search_gitbook_content, "integration"),
+        asyncio.to_thread(tools.analyze_existing_jira_tickets)
+    )
+    
     # Test GitBook API
     print("\n📚 Testing GitBook API...")
-    gitbook_result = tools.search_gitbook_content("integration")
     if gitbook_result["success"]:
         print("✅ GitBook API: Connected and working")
         print(f"   Content length: {len(gitbook_result['content'])}")
@@ -34,7 +39,6 @@ def test_cloud_function_connectivity():
     
     # Test Jira API
     print("\n🎫 Testing Jira API...")
-    jira_result = tools.analyze_existing_jira_tickets()
     if jira_result["success"]:
         print("✅ Jira API: Connected and working")
         print(f"   Tickets analyzed: {jira_result['ticket_count']}")
@@ -157,7 +161,7 @@ def run_comprehensive_test():
     test_results = {}
     
     # Test 1: Cloud Function Connectivity
-    test_results["cloud_functions"] = test_cloud_function_connectivity()
+    test_results["cloud_functions"] = asyncio.run(test_cloud_function_connectivity())
     
     # Test 2: Quality Gates
     test_results["quality_gates"] = test_quality_gates()
@@ -8,6 +8,8 @@ Uses internal GCP service-to-service authentication
 
 import requests
 import json
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from typing import Dict, List, Any, Optional
 from google.cloud import secretmanager
 from google.auth.transport.requests import Request
@@ -22,15 +24,34 @@ logger = logging.getLogger(__name__)
 class CloudFunctionTools:
     """Tools that integrate with deployed Cloud Functions using internal GCP authentication"""
     
-    def __init__(self, project_id: str = "service-execution-uat-bb7"):
+    def __init__(self, project_id: str = "service-execution-uat-bb7", pool_maxsize: int = 4,
+                 max_retries: int = 0):
         self.project_id = project_id
         self.gitbook_function_url = "https://gitbook-api-jlhinciqia-od.a.run.app"
         self.jira_function_url = "https://jira-api-jlhinciqia-od.a.run.app"
         
+        # Pooled HTTP session so Cloud Function calls reuse TLS connections
+        self.session = self._create_http_session(pool_maxsize, max_retries)
+        
         # Initialize GCP internal authentication
         self.credentials = None
         self._setup_internal_auth()
     
+    @staticmethod
+    def _create_http_session(pool_maxsize: int, max_retries: int = 0) -> requests.Session:
+        """Create an HTTP session with a connection pool; retries are opt-in via max_retries"""
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_maxsize=pool_maxsize,
+            max_retries=Retry(total=max_retries, backoff_factor=0.5) if max_retries else 0
+        )
+        session.mount("https://", adapter)
+        return session
+    
+    def close(self):
+        """Release pooled HTTP connections"""
+        self.session.close()
+    
     def _setup_internal_auth(self):
         """Setup internal GCP service-to-service authentication"""
         try:
@@ -81,7 +102,7 @@ class CloudFunctionTools:
             # Use internal GCP authentication for service-to-service calls
             headers = self._get_internal_auth_headers()
             
-            response = requests.post(
+            response = self.session.post(
                 self.gitbook_function_url,
                 json=payload,
                 headers=headers,
@@ -134,7 +155,7 @@ class CloudFunctionTools:
             # Use internal GCP authentication for service-to-service calls
             headers = self._get_internal_auth_headers()
             
-            response = requests.post(
+            response = self.session.post(
                 self.jira_function_url,
                 json=payload,
                 headers=headers,
@@ -208,7 +229,7 @@ class CloudFunctionTools:
             # Use internal GCP authentication for service-to-service calls
             headers = self._get_internal_auth_headers()
             
-            response = requests.post(
+            response = self.session.post(
                 self.jira_function_url,
                 json=payload,
                 headers=headers,